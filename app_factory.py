@@ -0,0 +1,259 @@
+""" FastAPI app factory - shared app setup for every entry module """
+import os
+import orjson
+import logging
+import threading
+from typing import Dict, Iterable
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+from fastapi.responses import ORJSONResponse, Response
+from fastapi import APIRouter, FastAPI, Request, HTTPException
+from movie_reccommender_system.db import db_select
+
+# basic logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",)
+# app factory logger
+logger = logging.getLogger("movielens_app_factory")
+
+# default app details
+API_VERSION="1.0.0"
+API_TITLE="Advance Movie Recommender System"
+
+# load .env only once per process
+_DOTENV_LOADED = False
+
+
+# load the dotenv once
+def load_dotenv_once():
+    """Function to load the .env file only on the first call."""
+    global _DOTENV_LOADED
+    # skip the os.environ walk if already loaded
+    if not _DOTENV_LOADED:
+        load_dotenv(override=False)
+        _DOTENV_LOADED = True
+
+
+# pure ASGI CORS middleware
+class FastCORSMiddleware:
+    """Minimal pure ASGI CORS middleware for allow-all origins with credentials.
+
+    Matches the CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+    allow_methods=["*"], allow_headers=["*"]) setup it replaces: the request Origin is
+    echoed with 'Vary: Origin' (browsers reject '*' on credentialed requests), requested
+    headers are echoed on preflight, and only real preflights (Origin plus
+    Access-Control-Request-Method) are answered here. Requests without an Origin pass
+    through untouched, so route OPTIONS handlers and 405s still work.
+    """
+    def __init__(
+            self,
+            app,
+            allow_credentials: bool = True,
+            allow_methods: bytes = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+            max_age: bytes = b"600"):
+        # wrapped asgi app
+        self.app = app
+        # origin-independent headers built once at construction
+        self._credentials_headers = [(b"access-control-allow-credentials", b"true")] if allow_credentials else []
+        self._preflight_headers = [
+            (b"access-control-allow-methods", allow_methods),
+            (b"access-control-max-age", max_age),
+            (b"content-length", b"0"),]
+        self._allow_credentials = allow_credentials
+
+    # allow-origin headers for one request origin
+    def origin_headers(self, origin: bytes):
+        """Function to build the allow-origin headers (echoed origin when credentials are allowed)."""
+        if self._allow_credentials:
+            return [(b"access-control-allow-origin", origin)] + self._credentials_headers
+        return [(b"access-control-allow-origin", b"*")]
+
+    async def __call__(self, scope, receive, send):
+        # lifespan/websocket scopes pass straight through
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # read the CORS request headers in one pass (asgi header names are lowercase)
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # not a cross-origin request -> nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # answer real preflights directly
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = self.origin_headers(origin) + self._preflight_headers
+            # allow every header -> echo the ones the browser asked for
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            if self._allow_credentials:
+                headers.append((b"vary", b"Origin"))
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        # append the allow-origin headers to the response start message
+        cors_headers = self.origin_headers(origin)
+        vary_origin = self._allow_credentials
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if vary_origin:
+                    # merge Origin into an existing Vary header, else add one
+                    for index, (name, value) in enumerate(headers):
+                        if name.lower() == b"vary":
+                            headers[index] = (name, value + b", Origin")
+                            break
+                    else:
+                        headers.append((b"vary", b"Origin"))
+                message["headers"] = headers + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+# pure ASGI health endpoints
+class HealthASGIMiddleware:
+    """Pure ASGI middleware to answer constant GET endpoints (e.g. /status, /version).
+
+    Response messages are built once from precomputed JSON bytes, so health probes
+    skip routing, validation and serialisation entirely.
+    """
+    def __init__(
+            self, 
+            app, 
+            bodies: Dict[str, bytes]):
+        # wrapped asgi app
+        self.app = app
+        # prebuilt (start, body) messages per path
+        self._responses = {
+            path: (
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),],},
+                {"type": "http.response.body", "body": body},)
+            for path, body in bodies.items()}
+
+    async def __call__(self, scope, receive, send):
+        # only constant GET paths are answered here
+        if scope["type"] == "http" and scope["method"] == "GET":
+            prebuilt = self._responses.get(scope["path"])
+            if prebuilt is not None:
+                # copy the start message so downstream header edits never touch the template
+                start_message, body_message = prebuilt
+                await send(dict(start_message))
+                await send(body_message)
+                return
+
+        await self.app(scope, receive, send)
+
+
+# app lifespan - one sqlite connection for the whole app
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # read the db path after .env is loaded
+    sqlite_db_path = os.getenv("SQLITE_DB_PATH", "./movie_reccommender_system/db/movies.db")
+    # make sure the db folder exists before connecting
+    os.makedirs(os.path.dirname(sqlite_db_path) or ".", exist_ok=True)
+    # open the shared PRAGMA-tuned connection once
+    app.state.db = db_select.open_sqlite_connection(sqlite_db_path)
+    # one threadpool request at a time on the shared connection
+    app.state.db_lock = threading.Lock()
+    try:
+        yield
+    finally:
+        # close on shutdown
+        app.state.db.close()
+
+
+# build the app
+def create_app(
+        routers: Iterable[APIRouter],
+        *,
+        version: str = API_VERSION,
+        title: str = API_TITLE) -> FastAPI:
+    """Function to build the FastAPI app with shared middleware, health endpoints and routers.
+
+    Args:
+        routers (Iterable[APIRouter]): Routers to include under the '/api' prefix.
+        version (str): API version string.
+        title (str): API title.
+
+    Returns:
+        FastAPI: The configured app.
+    """
+    # initiate the load_dotenv
+    load_dotenv_once()
+
+    # initiate the app -> orjson serialiser as the default response class
+    app = FastAPI(
+        title=title,
+        version=version,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan)
+
+    # precompute the constant health/version bodies once
+    status_body = orjson.dumps({
+        "status": "running",
+        "message": "Movie Recommender System API is up & running!"})
+    version_body = orjson.dumps({
+        "version": version,
+        "title": title})
+
+    # answer /status and /version before the FastAPI router
+    app.add_middleware(
+        HealthASGIMiddleware, 
+        bodies={"/status": status_body, "/version": version_body})
+
+    # app webhook validation - OPTION
+    # Allow all origins
+    # allow all http methods
+    # allow all header (requested headers echoed on preflight)
+    # allow credentials (request origin echoed with Vary: Origin)
+    app.add_middleware(FastCORSMiddleware)
+
+    # app health check -> kept for the OpenAPI docs, served by HealthASGIMiddleware
+    @app.get("/status")
+    async def status():
+        return Response(status_body, media_type="application/json")
+
+    # app version check endpoint -> kept for the OpenAPI docs, served by HealthASGIMiddleware
+    @app.get("/version")
+    async def version_check():
+        return Response(version_body, media_type="application/json")
+
+    # db stats endpoint
+    # plain def -> Starlette runs the blocking COUNT queries in its threadpool, not on the event loop
+    @app.get("/db/stats")
+    def read_db_stats(request: Request):
+        try:
+            # reuse the app connection -> no open/close per request, serialised across threads
+            with request.app.state.db_lock:
+                return db_select.get_sqlite_movielens_stats(conn=request.app.state.db)
+        except Exception as db_stats_error:
+            logger.exception("DB stats failed.")
+            raise HTTPException(
+                status_code=500,
+                detail=f"DB stats failed: {str(db_stats_error)}")
+
+    # initiate the routers
+    for router in routers:
+        app.include_router(router, prefix="/api")
+
+    return app
@@ -10,9 +10,12 @@ Class handles:
 """
 import os
 import logging
+import threading
 from typing import Dict
+from contextlib import contextmanager
 import pandas as pd
 from movie_reccommender_system.data_ingestor import data_loader, db_ingestor
+from movie_reccommender_system.response_basemodel_validator.data_ingestor_model import InsertTD, GenresTD, StatsTD
 
 # set up basic logging once
 logging.basicConfig(
@@ -51,10 +54,53 @@ class MovieLensSqliteIngestor:
         self.data_folder_path = data_folder_path
         self.db_file_path = db_file_path
         self.chunk_size = chunk_size
+        # one PRAGMA-tuned connection shared by every step of a run -> opened lazily by connection()
+        self.conn = None
+        # serialise steps that share the connection (API worker threads)
+        self._lock = threading.RLock()
+
+
+    # shared connection for one run
+    @contextmanager
+    def connection(self):
+        """Function to open the shared SQLite connection on first use and close it when the outermost step ends.
+
+        Nested steps (run_data_ingestor -> run_*) reuse the open connection, so nothing is
+        opened at construction/import time and nothing stays open between ingestion runs.
+
+        Yields:
+            sqlite3.Connection: The PRAGMA-tuned ingestion connection.
+        """
+        with self._lock:
+            # already inside a run -> reuse it
+            if self.conn is not None:
+                yield self.conn
+                return
+            self.conn = db_ingestor.open_sqlite_connection(self.db_file_path)
+            try:
+                yield self.conn
+            finally:
+                self.conn.close()
+                self.conn = None
+
+
+    # close the shared connection
+    def close(self):
+        """Function to close the shared SQLite connection if one is open."""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
     # insertion step
-    def run_movielens_data_insertion(self):
+    def run_movielens_data_insertion(self) -> InsertTD:
         """Function to load u.item and u.data, then insert into SQLite.
 
         Returns: 
@@ -67,20 +113,24 @@ class MovieLensSqliteIngestor:
                 }
         """
         logger.info("Loading raw files and inserting movies + ratings")
-        # initiate load_movielens_data() -  load raw MovieLens files into DataFrames
-        movies_df, ratings_df = data_loader.load_movielens_data(self.data_folder_path)
+        # initiate load_movies_data() -  load raw MovieLens movies file into DataFrame
+        movies_df = data_loader.load_movies_data(self.data_folder_path)
+        # initiate iter_ratings_batches() - stream ratings as row batches instead of a whole DataFrame
+        ratings_batches = data_loader.iter_ratings_batches(self.data_folder_path, self.chunk_size)
         # initiate  insert_movies_and_ratings_into_sqlite() - insert both tables into SQLite using indexes for fast queries
-        result = db_ingestor.insert_movies_and_ratings_into_sqlite(
-            movies_df=movies_df,
-            ratings_df=ratings_df,
-            db_file_path=self.db_file_path,
-            chunk_size=self.chunk_size)
+        with self.connection() as conn:
+            result = db_ingestor.insert_movies_and_ratings_into_sqlite(
+                movies_df=movies_df,
+                db_file_path=self.db_file_path,
+                chunk_size=self.chunk_size,
+                ratings_batches=ratings_batches,
+                conn=conn)
 
         return result
 
 
     # normalise genres
-    def run_genres_insertion(self):
+    def run_genres_insertion(self) -> GenresTD:
         """Function to build 'genres' and 'movie_genres' by reading genre flags from movies.
 
         Returns
@@ -94,13 +144,14 @@ class MovieLensSqliteIngestor:
         """
         logger.info("Creating genres and movie_genres tables..")
         # initiate create_genres_tbl() - to create the genres table
-        result = db_ingestor.create_genres_tbl(db_file_path=self.db_file_path)
+        with self.connection() as conn:
+            result = db_ingestor.create_genres_tbl(conn=conn)
 
         return result
 
 
     # collect movies and ratings stats
-    def run_movie_ratings_stats_insertion(self):
+    def run_movie_ratings_stats_insertion(self) -> StatsTD:
         """Function to compute avg_rating and num_ratings per movie, update the movies table.
 
         Returns:
@@ -113,7 +164,8 @@ class MovieLensSqliteIngestor:
         """
         logger.info("Computing avg_rating and num_ratings..")
         # initiaite create_movie_rating_stats_tbl() to create the movie rating stats tbl
-        result = db_ingestor.create_movie_rating_stats_tbl(db_file_path=self.db_file_path)
+        with self.connection() as conn:
+            result = db_ingestor.create_movie_rating_stats_tbl(conn=conn)
 
         return result
 
@@ -135,7 +187,23 @@ class MovieLensSqliteIngestor:
                     "genres_movie_ratings": {...},
                     "movie_rating_stats": {...}
                 }}
+            Plain dict, validated once at the API boundary via MovieLensIgenstorResponse.
         """
+        # hold the lock and one connection for the whole run so steps never interleave
+        with self.connection() as conn:
+            # keep every step's writes in the WAL on the same warm connection -> no checkpoint between steps
+            conn.execute("PRAGMA wal_autocheckpoint=0;")
+            try:
+                return self._run_data_ingestor_steps()
+            finally:
+                # back to the default auto-checkpoint and flush the WAL into the db file once
+                conn.execute("PRAGMA wal_autocheckpoint=1000;")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+
+
+    # ordered steps of run_data_ingestor
+    def _run_data_ingestor_steps(self):
+        """Function to run the three ingestion steps in order (caller holds the lock)."""
         # create a summary container
         ingestion_output_dict = {
             "success": False,
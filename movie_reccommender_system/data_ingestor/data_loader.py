@@ -2,7 +2,10 @@
 import os
 import sqlite3
 import logging
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from dotenv import load_dotenv
 from typing import Dict, Tuple
 
@@ -16,6 +19,51 @@ logging.basicConfig(
 # define the logger
 logger = logging.getLogger("movielens_loader")
 
+# define the 19 genre column names of u.item
+GENRE_COLUMNS = [
+    "unknown",
+    "Action",
+    "Adventure",
+    "Animation",
+    "Children",
+    "Comedy",
+    "Crime",
+    "Documentary",
+    "Drama",
+    "Fantasy",
+    "Film-Noir",
+    "Horror",
+    "Musical",
+    "Mystery",
+    "Romance",
+    "Sci-Fi",
+    "Thriller",
+    "War",
+    "Western",]
+# define all 24 column names of u.item
+MOVIE_COLUMNS = [
+    "movie_id",
+    "title",
+    "release_date",
+    "video_release_date",
+    "imdb_url",] + GENRE_COLUMNS
+# define the explicit arrow types for u.item -> genre flags stay int8 from parse time
+MOVIE_COLUMN_TYPES = {
+    "movie_id": pa.int64(),
+    "title": pa.string(),
+    "release_date": pa.string(),
+    "video_release_date": pa.string(),
+    "imdb_url": pa.string(),
+    **{genre: pa.int8() for genre in GENRE_COLUMNS},}
+# define the rating columns of u.data
+RATING_COLUMNS = ["user_id", "movie_id", "rating", "unix_time"]
+# define the explicit arrow types for u.data
+RATING_COLUMN_TYPES = {
+    "user_id": pa.int64(),
+    "movie_id": pa.int64(),
+    "rating": pa.int8(),
+    "unix_time": pa.int64(),}
+
 
 # load movie data
 def load_movielens_data(data_folder_path: str):
@@ -29,87 +77,122 @@ def load_movielens_data(data_folder_path: str):
     """
     # build file paths for the MovieLens files
     movies_file_path = os.path.join(data_folder_path, "u.item")
-    logger.info(f"Movies file path: {movies_file_path}")
+    logger.info("Movies file path: %s", movies_file_path)
     ratings_file_path = os.path.join(data_folder_path, "u.data")
-    logger.info(f"Ratings file path: {ratings_file_path}")
+    logger.info("Ratings file path: %s", ratings_file_path)
 
     # check both files exist under data_raw dir
     if not os.path.isfile(movies_file_path):
-        logger.error(f"Movies file not found: {movies_file_path}")
+        logger.error("Movies file not found: %s", movies_file_path)
         raise FileNotFoundError(f"Missing file: {movies_file_path}")
     if not os.path.isfile(ratings_file_path):
-        logger.error(f"Ratings file not found: {ratings_file_path}")
+        logger.error("Ratings file not found: %s", ratings_file_path)
         raise FileNotFoundError(f"Missing file: {ratings_file_path}")
 
     # read movies file (pipe-separated)
-    logger.info("Loading movies data...")
-    movies_df = pd.read_csv(
-        movies_file_path,
-        sep="|",
-        header=None,
-        encoding="latin-1",
-        # usecols=[0,1,2,3,4],
-        dtype={
-            0: "int64",
-            1: "string",
-            2: "string",
-            3: "string",
-            4: "string",},)
-    # defien the columns
-    # movies_df.columns = ["movie_id", "title", "release_date", "video_release_date", "imdb_url"]
-    # define all 24 column names
-    movies_df.columns = [
-        "movie_id",
-        "title",
-        "release_date",
-        "video_release_date",
-        "imdb_url",
-        "unknown",
-        "Action",
-        "Adventure",
-        "Animation",
-        "Children",
-        "Comedy",
-        "Crime",
-        "Documentary",
-        "Drama",
-        "Fantasy",
-        "Film-Noir",
-        "Horror",
-        "Musical",
-        "Mystery",
-        "Romance",
-        "Sci-Fi",
-        "Thriller",
-        "War",
-        "Western",]
-
-    # convert data types
-    movies_df["movie_id"] = movies_df["movie_id"].astype("int64")
-    for col in movies_df.columns[5:]:
-        movies_df[col] = movies_df[col].astype("int8")
-    logger.info(f"Movies data loaded successfully with rows: {len(movies_df)}")
+    movies_df = load_movies_data(data_folder_path)
 
     # read ratings file (tab-separated)
     logger.info("Loading ratings data...")
-    ratings_df = pd.read_csv(
+    ratings_df = pv.read_csv(
         ratings_file_path,
-        sep="\t",
-        header=None,
-        dtype={
-            0: "int64",
-            1: "int64",
-            2: "int8",
-            3: "int64",
-        },)
-    # define the rating columns
-    ratings_df.columns = ["user_id", "movie_id", "rating", "unix_time"]
-    logger.info(f"Ratings data loaded successfully with rows: {len(ratings_df)}")
+        read_options=pv.ReadOptions(
+            column_names=RATING_COLUMNS,
+            block_size=1 << 20),
+        parse_options=pv.ParseOptions(delimiter="\t"),
+        convert_options=pv.ConvertOptions(
+            column_types=RATING_COLUMN_TYPES),).to_pandas()
+    logger.info("Ratings data loaded successfully with rows: %s", len(ratings_df))
 
     return movies_df, ratings_df
 
 
 
+# load movies data
+def load_movies_data(data_folder_path: str):
+    """Function to load the MovieLens 'u.item' file into a pandas DataFrame.
+
+    Args:
+        data_folder_path : str (Path to the folder with 'u.item').
+
+    Returns
+        pandas.DataFrame: movies_df with all 24 columns.
+    """
+    # build movies file path
+    movies_file_path = os.path.join(data_folder_path, "u.item")
+    # check file exist under data_raw dir
+    if not os.path.isfile(movies_file_path):
+        logger.error("Movies file not found: %s", movies_file_path)
+        raise FileNotFoundError(f"Missing file: {movies_file_path}")
+
+    # read movies file (pipe-separated) with pyarrow multithreaded csv reader
+    logger.info("Loading movies data...")
+    movies_df = pv.read_csv(
+        movies_file_path,
+        read_options=pv.ReadOptions(
+            column_names=MOVIE_COLUMNS,
+            encoding="latin-1",
+            block_size=1 << 20),
+        parse_options=pv.ParseOptions(delimiter="|"),
+        convert_options=pv.ConvertOptions(
+            column_types=MOVIE_COLUMN_TYPES,
+            strings_can_be_null=True),).to_pandas()
+    # genre columns are already int8 at parse time -> no astype loop needed
+    # keep movie_id sorted so id lookups can use binary search (u.item is already sorted)
+    if not movies_df["movie_id"].is_monotonic_increasing:
+        movies_df = movies_df.sort_values("movie_id").reset_index(drop=True)
+    logger.info("Movies data loaded successfully with rows: %s", len(movies_df))
+
+    return movies_df
+
+
+
+# stream ratings data
+def iter_ratings_batches(
+        data_folder_path: str, 
+        chunk_size: int = 5000):
+    """Function to stream u.data as small batches of row tuples.
+
+    Args:
+        data_folder_path (str): Path to the folder with 'u.data'.
+        chunk_size (int): Max rows per yielded batch.
+
+    Returns:
+        Generator: yields lists of (user_id, movie_id, rating, unix_time) tuples, up to chunk_size long.
+            The file is checked and opened eagerly, so a missing file fails before any DB work.
+    """
+    # build ratings file path
+    ratings_file_path = os.path.join(data_folder_path, "u.data")
+    # check file exist under data_raw dir
+    if not os.path.isfile(ratings_file_path):
+        logger.error("Ratings file not found: %s", ratings_file_path)
+        raise FileNotFoundError(f"Missing file: {ratings_file_path}")
+
+    # open a streaming reader -> memory stays O(block) instead of O(file)
+    logger.info("Streaming ratings data in batches of rows: %s", chunk_size)
+    reader = pv.open_csv(
+        ratings_file_path,
+        read_options=pv.ReadOptions(
+            column_names=RATING_COLUMNS,
+            block_size=1 << 20),
+        parse_options=pv.ParseOptions(delimiter="\t"),
+        convert_options=pv.ConvertOptions(
+            column_types=RATING_COLUMN_TYPES),)
+
+    # generator over the reader
+    def generate_batches():
+        # go over each arrow record batch
+        for record_batch in reader:
+            # re-slice the batch so callers get at most chunk_size rows
+            for offset in range(0, record_batch.num_rows, chunk_size):
+                batch = record_batch.slice(offset, chunk_size)
+                # zip columns into plain python tuples for executemany
+                yield list(zip(*(column.to_pylist() for column in batch.columns)))
+
+    return generate_batches()
+
+
+
 # item EDA
 def eda_movies(movies_df):
     """ Function to explore the simple EDA for u.item data.
@@ -123,19 +206,23 @@ def eda_movies(movies_df):
             - How many movies are there?
             - Which genres are most common?
     """
-    # count unique movie IDs (should be 1682 in ML-100k)
-    total_movies = movies_df["movie_id"].nunique()
+    # count movies (movie_id is unique per row -> 1682 in ML-100k)
+    total_movies = int(movies_df.shape[0])
 
     # check which genres are most common: 
     # genre flags start from column index 5 (after imdb_url).
-    # each genre column is binary (0/1).
-    # summing them gives the number of movies in each genre.
-    genre_counts = movies_df.iloc[:, 5:].sum().sort_values(ascending=False)
+    # each genre column is binary (0/1) int8.
+    # one vectorised column sum over the int8 block gives the number of movies in each genre.
+    genre_block = movies_df.iloc[:, 5:].to_numpy(dtype=np.int8, copy=False)
+    counts = genre_block.sum(axis=0, dtype=np.int64)
+    genre_names = movies_df.columns[5:]
+    # order genres by count (descending, stable for ties)
+    order = np.argsort(-counts, kind="stable")
 
     # return results in a dictionary for easy testing or logging
     return {
         "total_movies": total_movies,
-        "genre_counts": genre_counts.to_dict(),}
+        "genre_counts": dict(zip(genre_names[order], counts[order].tolist())),}
 
 
 # rating EDA
@@ -160,22 +247,26 @@ def eda_ratings(
     # how many ratings do we have -> Simply the number of rows in the ratings dataframe
     total_ratings = len(ratings_df)
 
-    # what is the most common rating score -> count how many times each rating value (1–5) occurs
-    rating_distribution = ratings_df["rating"].value_counts().sort_index()
-    # get the score with the maximum count
-    most_common_rating = int(rating_distribution.idxmax())
-    most_common_rating_count = int(rating_distribution.max())
+    # what is the most common rating score -> histogram of rating values (1–5) in one bincount pass
+    rating_distribution = np.bincount(ratings_df["rating"].to_numpy(), minlength=6)
+    # get the score with the maximum count (skip the unused 0 bin)
+    most_common_rating = int(rating_distribution[1:].argmax() + 1)
+    most_common_rating_count = int(rating_distribution[most_common_rating])
 
 
-    # which movie is most rated -> group by movie_id and count how many ratings each movie received
-    ratings_per_movie = ratings_df.groupby("movie_id")["rating"].count()
+    # which movie is most rated -> movie_id is a dense integer key, so bincount gives ratings per movie
+    ratings_per_movie = np.bincount(ratings_df["movie_id"].to_numpy())
     # find the movie ID with the most ratings
-    most_rated_movie_id = int(ratings_per_movie.idxmax())
-    most_rated_count = int(ratings_per_movie.max())
-
-    # get the movie title for most rated movie
-    most_rated_movie_title = movies_df.loc[
-        movies_df["movie_id"] == most_rated_movie_id, "title"].values[0]
+    most_rated_movie_id = int(ratings_per_movie.argmax())
+    most_rated_count = int(ratings_per_movie[most_rated_movie_id])
+
+    # get the movie title for most rated movie -> binary search on the sorted movie_id column
+    movie_ids = movies_df["movie_id"].to_numpy()
+    title_index = int(np.searchsorted(movie_ids, most_rated_movie_id))
+    most_rated_movie_title = (
+        movies_df["title"].iloc[title_index]
+        if title_index < len(movie_ids) and movie_ids[title_index] == most_rated_movie_id
+        else None)
 
     # return results in dictionary form
     return {
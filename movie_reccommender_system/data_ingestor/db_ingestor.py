@@ -2,7 +2,11 @@
 import os         
 import sqlite3    
 import logging    
-from typing import Dict  
+from itertools import chain
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
 import pandas as pd 
 from movie_reccommender_system.data_ingestor import data_loader
 
@@ -14,18 +18,65 @@ logging.basicConfig(
 logger = logging.getLogger("sqlite_inserter")  
 
 
+# movie columns stored as-is; the 19 genre flags go into genre_mask
+MOVIE_INFO_COLUMNS = ["movie_id", "title", "release_date", "video_release_date", "imdb_url"]
+# bit value of each genre, in data_loader.GENRE_COLUMNS order
+GENRE_BITS = np.left_shift(1, np.arange(len(data_loader.GENRE_COLUMNS), dtype=np.int64))
+# movie_genres unpivot built once -> one UNION ALL branch (bit test) per genre in a single statement
+GENRE_LINKS_SQL = "INSERT OR IGNORE INTO movie_genres (movie_id, genre_id) " + " UNION ALL ".join(
+    f"SELECT m.movie_id, g.genre_id FROM movies m JOIN genres g ON g.genre_name = '{genre_name}' "
+    f"WHERE (m.genre_mask & {genre_bit}) != 0"
+    for genre_name, genre_bit in zip(data_loader.GENRE_COLUMNS, GENRE_BITS.tolist())) + ";"
+# safe bound-parameter limit per statement (SQLITE_MAX_VARIABLE_NUMBER on older builds)
+SQLITE_MAX_PARAMS = 999
+# ratings insert head -> VALUES groups are appended by build_multi_values_sql
+RATINGS_INSERT_SQL = "INSERT INTO ratings (user_id, movie_id, rating, unix_time) VALUES "
+
+
+# open the shared ingestion connection
+def open_sqlite_connection(db_file_path: str) -> sqlite3.Connection:
+    """Function to open one SQLite connection tuned for bulk ingestion, reused across all steps.
+
+    Args
+        db_file_path (str): Path for the SQLite database file (it will be created if missing).
+
+    Returns:
+        sqlite3.Connection: connection usable from the API worker threads.
+    """
+    # make sure the folder for the database file exists
+    os.makedirs(os.path.dirname(db_file_path) or ".", exist_ok=True)
+    # open the connection once -> autocommit mode, each step issues its own BEGIN/COMMIT
+    conn = sqlite3.connect(db_file_path, check_same_thread=False, isolation_level=None)
+    # use write-ahead logging
+    conn.execute("PRAGMA journal_mode=WAL;")
+    # fewer fsyncs during bulk writes
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    # keep temp b-trees in memory
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    # 64 MB page cache
+    conn.execute("PRAGMA cache_size=-65536;")
+    # 256 MB memory-mapped I/O
+    conn.execute("PRAGMA mmap_size=268435456;")
+    # wait for other writers instead of failing straight away
+    conn.execute("PRAGMA busy_timeout=5000;")
+    return conn
+
+
 # insert data into DB 
 def insert_movies_and_ratings_into_sqlite(
     movies_df: pd.DataFrame,
-    ratings_df: pd.DataFrame,
+    ratings_df: pd.DataFrame = None,
     db_file_path: str = "movie_reccommender_system/db/movies.db",
-    chunk_size: int = 5000):
+    chunk_size: int = 5000,
+    ratings_batches: Iterable[List[Tuple]] = None,
+    conn: sqlite3.Connection = None,
+    verify: bool = False):
     """Function to insert MovieLens data frames into a SQLite database.
         Function:
         1) opens (or creates) the database file,
         2) tunes PRAGMAs for faster bulk insert,
-        3) creates the tables with a fixed schema,
-        4) inserts rows in chunks for speed,
+        3) creates the tables with a fixed schema (tables and rows inside one BEGIN IMMEDIATE ... COMMIT),
+        4) inserts rows with one executemany per table (or per streamed ratings batch),
         5) builds useful indexes,
         6) returns row counts for tests.
 
@@ -36,154 +87,242 @@ def insert_movies_and_ratings_into_sqlite(
         db_file_path : str
             Path for the SQLite database file (it will be created if missing).
         chunk_size : int
-            How many rows to send per batch insert (bigger is faster, but uses more memory).
+            Kept for backward compatibility; data frame rows are no longer chunked
+            (streamed ratings_batches carry their own size).
+        ratings_batches : Iterable[List[Tuple]]
+            Optional stream of ratings row batches (e.g. data_loader.iter_ratings_batches),
+            used instead of ratings_df so ratings never sit in memory as a whole.
+        conn : sqlite3.Connection
+            Optional open connection to reuse (e.g. the ingestor's shared connection).
+        verify : bool
+            Re-count both tables with SELECT COUNT(*) instead of trusting the insert counters.
 
     Returns:
         Dict[str, int] Dictionary with row counts:
             {"movie_rows": <int>, "rating_rows": <int>}
+
+    Raises:
+        ValueError: If neither ratings_df nor ratings_batches is given.
     """
-    # make sure the folder for the database file exists
-    os.makedirs(os.path.dirname(db_file_path), exist_ok=True) 
-
-    # open a connection to the SQLite file
-    with sqlite3.connect(db_file_path) as db:
-        # tune SQLite to be faster for bulk inserts
-        # use write-ahead logging
-        db.execute("PRAGMA journal_mode=WAL;")    
-        # fewer fsyncs during bulk writes
-        db.execute("PRAGMA synchronous=NORMAL;")  
-         # keep foreign keys checks on
-        db.execute("PRAGMA foreign_keys=ON;")    
-
-        # create fresh tables so schema is always correct
-        logger.info("Creating tables 'movies' and 'ratings'...")
-        # make both tables from scratch
-        create_movies_ratings_tbl(db) 
-
-        # prepare SQL for inserting into the movies table
-        movies_sql = """
-            INSERT INTO movies (
-                movie_id, title, release_date, video_release_date, imdb_url,
-                unknown, Action, Adventure, Animation, Children, Comedy, Crime,
-                Documentary, Drama, Fantasy, "Film-Noir", Horror, Musical,
-                Mystery, Romance, "Sci-Fi", Thriller, War, Western
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);"""
-
-        # turn the movies data frame into an iterator of pure Python tuples
-        # convert NaN to None for each value
-        movies_rows = (
-            tuple(change_none_if_nan(v) for v in row)  
-            for row in movies_df.itertuples(index=False, name=None))  
-
-        # insert the movies in chunks for speed and low memory
-        logger.info(f"Inserting movies in chunks of rows: {chunk_size}")  
-        # keep a running count
-        total_movie_rows = 0               
-        # get next batch           
-        for chunk in split_into_chunks(movies_rows, chunk_size): 
-            # insert the whole batch at once 
-            db.executemany(movies_sql, chunk)         
-            # add how many we just inserted  
-            total_movie_rows += len(chunk)              
-
-        # prepare SQL for inserting into the ratings table
-        ratings_sql = """
-            INSERT INTO ratings (user_id, movie_id, rating, unix_time)
-            VALUES (?, ?, ?, ?);"""
-
-        # turn the ratings data frame into an iterator of pure Python tuples
-        # convert NaN to None for each value
-        ratings_rows = (
-            tuple(change_none_if_nan(v) for v in row)   
-            for row in ratings_df.itertuples(index=False, name=None) )
-
-        # insert the ratings in chunks
-        logger.info(f"Inserting ratings in chunks of rows: {chunk_size}")
-        # keep a running count
-        total_rating_rows = 0        
-        # get next batch                   
-        for chunk in split_into_chunks(ratings_rows, chunk_size):  
-            # insert the whole batch at once
-            db.executemany(ratings_sql, chunk) 
-            # add how many we just inserted         
-            total_rating_rows += len(chunk)             
-
-        # create helpful indexes for faster queries later
-        logger.info(f"Creating indexes for faster lookups...") 
-        # find by title fast 
-        db.execute(f"CREATE INDEX IF NOT EXISTS idx_movies_title ON movies(title);")   
-        # find movie ratings fast   
-        db.execute(f"CREATE INDEX IF NOT EXISTS idx_ratings_movie ON ratings(movie_id);") 
-        # find user ratings fast
-        db.execute(f"CREATE INDEX IF NOT EXISTS idx_ratings_user  ON ratings(user_id);")  
-
-        # verify row counts with a simple SELECT (defensive check)
-         # how many movies now in DB
-        movie_count = db.execute("SELECT COUNT(*) FROM movies;").fetchone()[0]  
-        # how many ratings now in DB
-        rating_count = db.execute("SELECT COUNT(*) FROM ratings;").fetchone()[0] 
-
-        # log final counts so we can see what happened
-        logger.info(f"Inserted movies: {movie_count} and ratings: {rating_count}") 
-
-        # return counts so tests can assert exact numbers
-        return {
-            "status":"success",
-            "message":"Successfully inserting records.",
-            "movie_rows": int(movie_count), 
-            "rating_rows": int(rating_count)}  
+    # ratings must come from somewhere
+    if ratings_df is None and ratings_batches is None:
+        raise ValueError("Either ratings_df or ratings_batches must be provided.")
+    # the data frame is one lazy batch -> converted on the prep thread like a streamed one
+    if ratings_batches is None:
+        ratings_batches = map(dataframe_to_sqlite_rows, [ratings_df])
+
+    # reuse the given connection, else open a tuned autocommit connection (we control the transaction ourselves)
+    owns_connection = conn is None
+    if owns_connection:
+        conn = open_sqlite_connection(db_file_path)
+
+    # tune SQLite to be faster for bulk inserts
+    # use write-ahead logging
+    conn.execute("PRAGMA journal_mode=WAL;")    
+    # fewer fsyncs during bulk writes
+    conn.execute("PRAGMA synchronous=NORMAL;")  
+    # keep temp b-trees and sorts in memory
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    # 128 MB page cache
+    conn.execute("PRAGMA cache_size=-131072;")
+    # 256 MB memory-mapped I/O
+    conn.execute("PRAGMA mmap_size=268435456;")
+    # no foreign keys are declared, so skip the checks during the load
+    conn.execute("PRAGMA foreign_keys=OFF;")
+
+    # read/convert the next ratings batch on a worker thread while the current one is inserted
+    # (pyarrow, NumPy and sqlite3 release the GIL) -> the first batch overlaps the movies insert
+    prep_pool = ThreadPoolExecutor(max_workers=1)
+    ratings_iter = iter(ratings_batches)
+    next_batch = prep_pool.submit(next, ratings_iter, None)
 
+    try:
+        # rollback on error (the explicit COMMIT below ends the load transaction on success)
+        with conn as db:
+            # one explicit write transaction for the whole load -> a single commit/fsync
+            db.execute("BEGIN IMMEDIATE;")
+            # one cursor for every bulk insert -> no per-call cursor objects
+            cur = db.cursor()
+
+            # create fresh tables so schema is always correct
+            logger.info("Creating tables 'movies' and 'ratings'...")
+            # make both tables from scratch
+            create_movies_ratings_tbl(db) 
+
+            # prepare SQL for inserting into the movies table -> 19 genre flags packed into genre_mask
+            movies_sql = """
+                INSERT INTO movies (
+                    movie_id, title, release_date, video_release_date, imdb_url, genre_mask
+                )
+                VALUES (?, ?, ?, ?, ?, ?);"""
+
+            # info columns plus the packed genre bits
+            movies_frame = movies_df[MOVIE_INFO_COLUMNS].assign(genre_mask=build_genre_mask(movies_df))
+            # turn the movies data frame into pure Python rows (NaN -> None, vectorised)
+            movies_rows = dataframe_to_sqlite_rows(movies_frame)
+
+            # insert all movies in one call (already inside the load transaction)
+            logger.info("Inserting movies rows: %s", len(movies_rows))  
+            cur.executemany(movies_sql, movies_rows)         
+            # keep the inserted count
+            total_movie_rows = len(movies_rows)              
+
+            # insert the ratings batch by batch
+            logger.info("Inserting ratings...")
+            # keep a running count
+            total_rating_rows = 0        
+            # get next batch -> None once the stream is exhausted
+            while (chunk := next_batch.result()) is not None:
+                # start preparing the following batch before inserting this one
+                next_batch = prep_pool.submit(next, ratings_iter, None)
+                # insert the whole batch with multi-row VALUES statements
+                executemany_multi_values(cur, RATINGS_INSERT_SQL, chunk, len(data_loader.RATING_COLUMNS)) 
+                # add how many we just inserted         
+                total_rating_rows += len(chunk)             
+
+            # commit tables and rows in one go
+            db.execute("COMMIT;")
+
+            # create helpful indexes for faster queries later -> all DDL in one script and one transaction
+            logger.info("Creating indexes for faster lookups...") 
+            # title lookups, covering (movie_id, rating) for per-movie AVG/COUNT,
+            # index-only rating buckets, user lookups, then refresh planner statistics
+            db.executescript("""
+                BEGIN;
+                CREATE INDEX IF NOT EXISTS idx_movies_title ON movies(title);
+                CREATE INDEX IF NOT EXISTS idx_ratings_movie_rating ON ratings(movie_id, rating);
+                CREATE INDEX IF NOT EXISTS idx_ratings_rating ON ratings(rating);
+                CREATE INDEX IF NOT EXISTS idx_ratings_user ON ratings(user_id);
+                COMMIT;
+                ANALYZE;""")
+
+            # the insert counters are exact -> no full-table COUNT(*) scans
+            movie_count, rating_count = total_movie_rows, total_rating_rows
+            # verify row counts with a simple SELECT only when asked (defensive check)
+            if verify:
+                # how many movies now in DB
+                movie_count = db.execute("SELECT COUNT(*) FROM movies;").fetchone()[0]  
+                # how many ratings now in DB
+                rating_count = db.execute("SELECT COUNT(*) FROM ratings;").fetchone()[0] 
+
+            # log final counts so we can see what happened
+            logger.info("Inserted movies: %s and ratings: %s", movie_count, rating_count) 
+
+            # return counts so tests can assert exact numbers
+            return {
+                "status":"success",
+                "message":"Successfully inserting records.",
+                "movie_rows": int(movie_count), 
+                "rating_rows": int(rating_count)}  
+    finally:
+        # stop the prep worker, dropping a prefetch nobody will read
+        prep_pool.shutdown(wait=True, cancel_futures=True)
+        # restore the load-only PRAGMA
+        conn.execute("PRAGMA foreign_keys=ON;")
+        # only close connections opened here
+        if owns_connection:
+            conn.close()
+
+
+# build the multi-row insert SQL once per shape
+@lru_cache(maxsize=32)
+def build_multi_values_sql(
+        insert_sql: str, 
+        column_count: int, 
+        row_count: int) -> str:
+    """Function to build an INSERT with row_count VALUES groups of column_count placeholders.
+
+    Args
+        insert_sql (str): Statement head ending in 'VALUES ', e.g. RATINGS_INSERT_SQL.
+        column_count (int): Number of columns per row.
+        row_count (int): Number of rows per statement.
+
+    Returns:
+        str: The full multi-row INSERT statement.
+    """
+    # one "(?, ?, ...)" group per row
+    row_placeholders = "(" + ", ".join(["?"] * column_count) + ")"
+    return insert_sql + ", ".join([row_placeholders] * row_count) + ";"
 
 
-# split data into chunks
-def split_into_chunks(
-        row_iterator, 
-        chunk_size: int):
-    """Function to split an iterator of rows into small lists of rows.
-        This is to helps us send many rows to SQLite in one call
-        (executemany), which is faster than one-by-one inserts.
+
+# insert rows with multi-row VALUES
+def executemany_multi_values(
+        cur: sqlite3.Cursor, 
+        insert_sql: str, 
+        rows: List, 
+        column_count: int):
+    """Function to insert rows packing as many as fit into each statement (one sqlite3_step per statement, not per row).
 
     Args
-        row_iterator: An iterator that gives us one row (tuple) at a time.
-        chunk_size (int): size to define the how many rows to group together in each chunk.
+        cur (sqlite3.Cursor): Cursor inside the open load transaction.
+        insert_sql (str): Statement head ending in 'VALUES '.
+        rows (List): Row sequences, each with column_count values.
+        column_count (int): Number of columns per row.
 
-    Yield: 
-        list: A list of rows (each row is a tuple), up to chunk_size long.
+    Returns:
+        None
     """
-    # start with an empty list to collect rows
-    chunk = [] 
-    # go over each row that comes from the iterator
-    for row in row_iterator: 
-        # add the row into the current batch 
-        chunk.append(row)    
-        # if the batch is big enough, give it back to the caller - check if we reached the limit
-        if len(chunk) >= chunk_size: 
-            # send the batch to the caller
-            yield chunk         
-             # reset the batch for the next rows      
-            chunk = []               
-    # after the loop, if any rows are left, send them too
-    if chunk:    
-        # send the final, smaller batch       
-        yield chunk    
+    # rows per statement within the bound-parameter limit
+    rows_per_statement = SQLITE_MAX_PARAMS // column_count
+    # full statements -> one executemany over flattened parameter lists
+    full_end = len(rows) - len(rows) % rows_per_statement
+    if full_end:
+        cur.executemany(
+            build_multi_values_sql(insert_sql, column_count, rows_per_statement),
+            (list(chain.from_iterable(rows[start:start + rows_per_statement])) 
+             for start in range(0, full_end, rows_per_statement)))
+    # shorter statement for the tail rows
+    tail_rows = rows[full_end:]
+    if tail_rows:
+        cur.execute(
+            build_multi_values_sql(insert_sql, column_count, len(tail_rows)),
+            list(chain.from_iterable(tail_rows)))
+
+
+
+# pack the genre flags
+def build_genre_mask(movies_df: pd.DataFrame) -> np.ndarray:
+    """Function to pack the 19 one-hot genre columns into one integer per movie.
+        Bit i is set when the movie has data_loader.GENRE_COLUMNS[i].
+
+    Args
+        movies_df (pandas.DataFrame): Data frame with the 19 MovieLens genre columns.
+
+    Returns:
+        numpy.ndarray: int64 genre mask per movie.
+    """
+    # (movies x 19) flags dot (19,) bit values -> one mask per row in C
+    genre_flags = movies_df[data_loader.GENRE_COLUMNS].to_numpy(dtype=np.int64)
+    return genre_flags @ GENRE_BITS
+
 
 
 # handle the NaNs
-def change_none_if_nan(value):
-    """Function to change a NaN (Not a Number) into None so SQLite stores NULL.
+def dataframe_to_sqlite_rows(data_frame: pd.DataFrame) -> List[List]:
+    """Function to turn a data frame into plain Python rows, with NaN changed into None so SQLite stores NULL.
+        Only columns that can hold NaN (float/object/string) are checked; integer and bool columns go straight through.
 
     Args
-        value : The value to check.
+        data_frame (pandas.DataFrame): The data frame to convert.
 
     Returns:
-        The same value if it is not missing, or None if it is missing.
+        List[List]: One list of Python values per row (executemany takes any sequence, no tuples needed).
     """
-    # if the value is considered missing by pandas, return None
-    if pd.isna(value): 
-        return None     
-    # otherwise return the value as-is
-    return value       
+    # integer/bool columns can never be missing -> skip them (e.g. the whole ratings frame)
+    nullable_columns = [
+        column for column, dtype in data_frame.dtypes.items() 
+        if dtype.kind not in "iub" and data_frame[column].hasnans]
+    # swap missing values for None only in the columns that actually have them
+    if nullable_columns:
+        data_frame = data_frame.assign(**{
+            column: data_frame[column].astype(object).where(data_frame[column].notna(), None)
+            for column in nullable_columns})
+    # all-integer frames (e.g. ratings) -> one contiguous int64 block, transposed to rows in C
+    if all(dtype.kind in "iu" for dtype in data_frame.dtypes):
+        return data_frame.to_numpy(dtype=np.int64).tolist()
+    # tolist() builds the rows in C with Python scalars (int/float/str), which sqlite3 can bind
+    return data_frame.to_numpy(dtype=object).tolist()
 
 
 
@@ -199,7 +338,7 @@ def create_movies_ratings_tbl(db_connection: sqlite3.Connection):
     """
     # drop old movies table if it exists
     db_connection.execute("DROP TABLE IF EXISTS movies;")  # start clean
-    # create a new movies table with 24 columns (MovieLens spec)
+    # create a new movies table -> the 19 MovieLens genre flags packed into one genre_mask bitfield
     db_connection.execute("""
         CREATE TABLE movies (
             movie_id INTEGER PRIMARY KEY,
@@ -207,25 +346,7 @@ def create_movies_ratings_tbl(db_connection: sqlite3.Connection):
             release_date TEXT,                 
             video_release_date TEXT,            
             imdb_url TEXT,                
-            unknown INTEGER,              
-            Action INTEGER,
-            Adventure INTEGER,
-            Animation INTEGER,
-            Children INTEGER,
-            Comedy INTEGER,
-            Crime INTEGER,
-            Documentary INTEGER,
-            Drama INTEGER,
-            Fantasy INTEGER,
-            "Film-Noir" INTEGER,
-            Horror INTEGER,
-            Musical INTEGER,
-            Mystery INTEGER,
-            Romance INTEGER,
-            "Sci-Fi" INTEGER,
-            Thriller INTEGER,
-            War INTEGER,
-            Western INTEGER);""")
+            genre_mask INTEGER);""")
 
     # drop old ratings table if it exists
     db_connection.execute("DROP TABLE IF EXISTS ratings;")
@@ -241,23 +362,25 @@ def create_movies_ratings_tbl(db_connection: sqlite3.Connection):
 
 
 # creating the genre table
-def create_genres_tbl(db_file_path: str):
+def create_genres_tbl(
+        db_file_path: str = None, 
+        conn: sqlite3.Connection = None):
     """Function to create and fill the 'genres' and 'movie_genres' tables.
 
     Args:
         db_file_path (str): Path to the SQLite database file that already has a 'movies' table.
+        conn (sqlite3.Connection): Optional open connection to reuse; it is left open.
 
     Returns:
         Dict: Containing the success message and logs.
     """
     # list of genre column names as they appear in u.item
-    genre_names= [
-        "unknown", "Action", "Adventure", "Animation", "Children", "Comedy", "Crime",
-        "Documentary", "Drama", "Fantasy", "Film-Noir", "Horror", "Musical",
-        "Mystery", "Romance", "Sci-Fi", "Thriller", "War", "Western"]
+    genre_names = data_loader.GENRE_COLUMNS
 
-    # open a connection to the SQLite database file
-    conn = sqlite3.connect(db_file_path)
+    # reuse the given connection, else open one with the same ingestion PRAGMAs
+    owns_connection = conn is None
+    if owns_connection:
+        conn = open_sqlite_connection(db_file_path)
     # create a cursor so we can run SQL commands
     cur = conn.cursor()
 
@@ -272,10 +395,10 @@ def create_genres_tbl(db_file_path: str):
                 genre_id INTEGER PRIMARY KEY,
                 genre_name TEXT UNIQUE);""")
 
-        # insert each genre name as one row into the 'genres' table
-        for name in genre_names:
-            # insert or ignore so we do not fail if it already exists
-            cur.execute("INSERT OR IGNORE INTO genres (genre_name) VALUES (?);", (name,))
+        # insert all genre names as rows into the 'genres' table in one call
+        cur.executemany(
+            "INSERT OR IGNORE INTO genres (genre_name) VALUES (?);", 
+            [(name,) for name in genre_names])
 
         # drop the 'movie_genres' table if it exists so we start clean
         cur.execute("DROP TABLE IF EXISTS movie_genres;")
@@ -286,43 +409,24 @@ def create_genres_tbl(db_file_path: str):
                 genre_id INTEGER,
                 PRIMARY KEY (movie_id, genre_id));""")
 
-        # define total count of link placehlder
-        link_count=0
-        # for each genre, we select all movie_id where the flag is 1 and insert links
-        for name in genre_names:
-            # get the numeric id for this genre name
-            cur.execute("SELECT genre_id FROM genres WHERE genre_name = ?;", (name,))
-            row = cur.fetchone()
-            # if the genre id is not found, skip
-            if not row:
-                continue
-            genre_id = int(row[0])
-
-            # build SQL that picks movie_id where this genre flag equals 1
-            sql = f"SELECT movie_id FROM movies WHERE \"{name}\" = 1;"
-            # run the query to get all matching movie ids
-            cur.execute(sql)
-            movie_rows = cur.fetchall()
-
-            # insert one row into movie_genres for each (movie_id, genre_id) pair
-            for (movie_id,) in movie_rows:
-                cur.execute(
-                    "INSERT OR IGNORE INTO movie_genres (movie_id, genre_id) VALUES (?, ?);",
-                    (int(movie_id), genre_id),)
-                # increament the total link count
-                link_count += 1
-
-        # create indexes to make genre queries fast
-        cur.execute(f"CREATE INDEX IF NOT EXISTS idx_genres_name ON genres(genre_name);")
-        cur.execute(f"CREATE INDEX IF NOT EXISTS idx_movie_genres_genre ON movie_genres(genre_id);")
-        cur.execute(f"CREATE INDEX IF NOT EXISTS idx_movie_genres_movie ON movie_genres(movie_id);")
+        # link movies to all genres with one static unpivot statement, no rows through Python
+        cur.execute(GENRE_LINKS_SQL)
+        # define total count of links
+        link_count = cur.rowcount
 
         # commit the transaction so all changes are saved
         conn.commit()
+        # create indexes to make genre queries fast -> one script, one transaction
+        cur.executescript("""
+            BEGIN;
+            CREATE INDEX IF NOT EXISTS idx_genres_name ON genres(genre_name);
+            CREATE INDEX IF NOT EXISTS idx_movie_genres_genre ON movie_genres(genre_id);
+            CREATE INDEX IF NOT EXISTS idx_movie_genres_movie ON movie_genres(movie_id);
+            COMMIT;""")
         # execute the count select
         cur.execute("SELECT COUNT(*) FROM genres;")
         genre_count = int(cur.fetchone()[0])
-        logger.info(f"Built {genre_count} genres and {link_count} movie-genre links.")
+        logger.info("Built %s genres and %s movie-genre links.", genre_count, link_count)
         return {
             "success": True,
             "message": "Genres normalized successfully.",
@@ -332,7 +436,7 @@ def create_genres_tbl(db_file_path: str):
     except Exception as ex:
         # if something goes wrong, roll back all changes
         conn.rollback()
-        logger.error(f"Failed to normalize genres: {str(ex)}")
+        logger.error("Failed to normalize genres: %s", ex)
         return {
             "success": False, 
             "message": str(ex), 
@@ -340,23 +444,29 @@ def create_genres_tbl(db_file_path: str):
             "movie_genre_links": 0}
 
     finally:
-        # always close the connection at the end
-        conn.close()
+        # always close the connection at the end (only if opened here)
+        if owns_connection:
+            conn.close()
 
 
 
 # update movie status
-def create_movie_rating_stats_tbl(db_file_path: str):
+def create_movie_rating_stats_tbl(
+        db_file_path: str = None, 
+        conn: sqlite3.Connection = None):
     """Function to add 'avg_rating' and 'num_ratings' to 'movies' and fill them from 'ratings'.
 
     Args
         db_file_path (str): Path to the SQLite database file.
+        conn (sqlite3.Connection): Optional open connection to reuse; it is left open.
 
     Returns:
         Dict: containing the success message and log.
     """
-    # open a connection to the SQLite database file
-    conn = sqlite3.connect(db_file_path)
+    # reuse the given connection, else open one with the same ingestion PRAGMAs
+    owns_connection = conn is None
+    if owns_connection:
+        conn = open_sqlite_connection(db_file_path)
     # create a cursor so we can run SQL commands
     cur = conn.cursor()
 
@@ -377,30 +487,57 @@ def create_movie_rating_stats_tbl(db_file_path: str):
         pass
 
     try:
-        # compute average rating and number of ratings per movie using the ratings table
-        cur.execute("""
-            WITH stats AS (
+        # compute average rating and number of ratings per movie in one pass over ratings
+        if sqlite3.sqlite_version_info >= (3, 33, 0):
+            # join-style UPDATE ... FROM -> one grouped scan of ratings, one pass over movies
+            cur.execute("""
+                UPDATE movies
+                SET
+                    avg_rating = stats.avg_rating,
+                    num_ratings = stats.num_ratings
+                FROM (
+                    SELECT
+                        movie_id,
+                        AVG(rating) AS avg_rating,
+                        COUNT(*) AS num_ratings
+                    FROM ratings
+                    GROUP BY movie_id
+                ) AS stats
+                WHERE movies.movie_id = stats.movie_id;""")
+        else:
+            # older SQLite -> materialise the stats once, then update by primary key lookups
+            cur.execute("DROP TABLE IF EXISTS temp.movie_stats;")
+            cur.execute("""
+                CREATE TEMP TABLE movie_stats AS
                 SELECT
                     movie_id,
                     AVG(rating) AS avg_rating,
                     COUNT(*) AS num_ratings
                 FROM ratings
-                GROUP BY movie_id
-            )
-            UPDATE movies
-            SET
-                avg_rating = (SELECT stats.avg_rating FROM stats WHERE stats.movie_id = movies.movie_id),
-                num_ratings = (SELECT stats.num_ratings FROM stats WHERE stats.movie_id = movies.movie_id);""")
-
-        # create indexes so sorting and filtering by these fields is fast
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_movies_avg ON movies(avg_rating);")
-        cur.execute("CREATE INDEX IF NOT EXISTS idx_movies_num ON movies(num_ratings);")
+                GROUP BY movie_id;""")
+            cur.execute("CREATE UNIQUE INDEX temp.idx_movie_stats_movie ON movie_stats(movie_id);")
+            cur.execute("""
+                UPDATE movies
+                SET
+                    avg_rating = (SELECT avg_rating FROM movie_stats WHERE movie_stats.movie_id = movies.movie_id),
+                    num_ratings = (SELECT num_ratings FROM movie_stats WHERE movie_stats.movie_id = movies.movie_id)
+                WHERE movie_id IN (SELECT movie_id FROM movie_stats);""")
+            cur.execute("DROP TABLE temp.movie_stats;")
 
         # commit all changes
         conn.commit()
+        # index the new stats columns (title index kept as a no-op safety net),
+        # then refresh planner statistics -> one script, one transaction
+        cur.executescript("""
+            BEGIN;
+            CREATE INDEX IF NOT EXISTS idx_movies_avg ON movies(avg_rating);
+            CREATE INDEX IF NOT EXISTS idx_movies_num ON movies(num_ratings);
+            CREATE INDEX IF NOT EXISTS idx_movies_title ON movies(title);
+            COMMIT;
+            ANALYZE;""")
         cur.execute("SELECT COUNT(*) FROM movies WHERE num_ratings IS NOT NULL;")
         updated_count = int(cur.fetchone()[0])
-        logger.info(f"Updated {updated_count} movies with avg_rating and num_ratings.")
+        logger.info("Updated %s movies with avg_rating and num_ratings.", updated_count)
         return {
             "success": True,
             "message": "Movie stats updated successfully.",
@@ -410,15 +547,16 @@ def create_movie_rating_stats_tbl(db_file_path: str):
         # if anything fails, roll back to keep the database clean
         conn.rollback()
         conn.rollback()
-        logger.error(f"Failed to update movie stats: {ex}")
+        logger.error("Failed to update movie stats: %s", ex)
         return {
             "success": False, 
             "message": str(ex), 
             "updated_movies": 0}
 
     finally:
-        # always close the connection
-        conn.close()
+        # always close the connection (only if opened here)
+        if owns_connection:
+            conn.close()
 
 
 
@@ -3,8 +3,35 @@ import sqlite3
 import pandas as pd
 from typing import Dict
 
+# open tuned read connection
+def open_sqlite_connection(db_file_path: str) -> sqlite3.Connection:
+    """Function to open one long-lived SQLite connection tuned for API reads.
+
+    Args
+        db_file_path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: autocommit connection usable from any thread.
+    """
+    # autocommit connection, shared by the app for its lifetime
+    conn = sqlite3.connect(db_file_path, check_same_thread=False, isolation_level=None)
+    # use write-ahead logging so readers do not block the ingestor
+    conn.execute("PRAGMA journal_mode=WAL;")
+    # fewer fsyncs
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    # keep temp b-trees in memory
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    # 64 MB page cache
+    conn.execute("PRAGMA cache_size=-65536;")
+    # 256 MB memory-mapped I/O
+    conn.execute("PRAGMA mmap_size=268435456;")
+    return conn
+
+
 # DB sanity check - to get the movielens stats using sqlite DB
-def get_sqlite_movielens_stats(db_file_path: str) -> Dict:
+def get_sqlite_movielens_stats(
+        db_file_path: str = None, 
+        conn: sqlite3.Connection = None) -> Dict:
     """Function to connect to a SQLite database and return simple stats.
         This function reports:
         - how many movies are in the movies table
@@ -13,7 +40,8 @@ def get_sqlite_movielens_stats(db_file_path: str) -> Dict:
         - which movie is most rated (id, title, count)
 
     Args
-        db_file_path (str): Path to the SQLite database file.
+        db_file_path (str): Path to the SQLite database file (used when conn is not given).
+        conn (sqlite3.Connection): Optional open connection to reuse; it is left open.
 
     Returns: 
         Dict: Dictionary with database stats - 
@@ -24,55 +52,64 @@ def get_sqlite_movielens_stats(db_file_path: str) -> Dict:
                 "most_rated_movie": {"id": int, "title": str, "count": int}
             }
     """
-    # open a connection to the SQLite database
-    conn = sqlite3.connect(db_file_path)
+    # reuse the given connection, else open a connection to the SQLite database
+    owns_connection = conn is None
+    if owns_connection:
+        conn = sqlite3.connect(db_file_path)
 
     try:
         # initiate the cursor
         cur = conn.cursor()
 
-        # define the total count - COUNT
-        cur.execute("SELECT COUNT(*) FROM movies;")
-        movie_count = int(cur.fetchone()[0])
-
-        # define the total ratings
-        cur.execute("SELECT COUNT(*) FROM ratings;")
-        rating_count = int(cur.fetchone()[0])
-
-        # select the most common rating
+        # all four stats in one round-trip -> LEFT JOINs keep the counts when ratings is empty
         cur.execute("""
-            SELECT rating, COUNT(*) as c
-            FROM ratings
-            GROUP BY rating
-            ORDER BY c DESC
-            LIMIT 1;""")
-        # cursor to fetch single row
-        row = cur.fetchone()
-        # get the most common rating
-        most_common_rating = {"score": int(row[0]), "count": int(row[1])} if row else {}
+            WITH
+                movie_total AS (SELECT COUNT(*) AS c FROM movies),
+                rating_total AS (SELECT COUNT(*) AS c FROM ratings),
+                common_rating AS (
+                    SELECT rating, COUNT(*) AS c
+                    FROM ratings
+                    GROUP BY rating
+                    ORDER BY c DESC
+                    LIMIT 1),
+                most_rated AS (
+                    SELECT r.movie_id, m.title, COUNT(*) AS c
+                    FROM ratings r
+                    JOIN movies m ON m.movie_id = r.movie_id
+                    GROUP BY r.movie_id
+                    ORDER BY c DESC
+                    LIMIT 1)
+            SELECT
+                movie_total.c, rating_total.c,
+                common_rating.rating, common_rating.c,
+                most_rated.movie_id, most_rated.title, most_rated.c
+            FROM movie_total
+            CROSS JOIN rating_total
+            LEFT JOIN common_rating ON 1
+            LEFT JOIN most_rated ON 1;""")
+        # cursor to fetch the single stats row
+        (movie_count, rating_count,
+         common_score, common_count,
+         movie_id, movie_title, movie_ratings) = cur.fetchone()
 
-        # select most common rating
-        cur.execute("""
-            SELECT r.movie_id, m.title, COUNT(*) as c
-            FROM ratings r
-            JOIN movies m ON m.movie_id = r.movie_id
-            GROUP BY r.movie_id
-            ORDER BY c DESC
-            LIMIT 1;""")
-        # cursor to fetch single row
-        row = cur.fetchone()
+        # get the most common rating
+        most_common_rating = {
+            "score": int(common_score), 
+            "count": int(common_count)} if common_score is not None else {}
         # get most rating movie
         most_rated_movie = {
-            "id": int(row[0]),
-            "title": row[1],
-            "count": int(row[2]),} if row else {}
+            "id": int(movie_id),
+            "title": movie_title,
+            "count": int(movie_ratings),} if movie_id is not None else {}
 
         # return all stats in a dictionary
         return {
-            "movie_count": movie_count,
-            "rating_count": rating_count,
+            "movie_count": int(movie_count),
+            "rating_count": int(rating_count),
             "most_common_rating": most_common_rating,
             "most_rated_movie": most_rated_movie,}
 
     finally:
-        conn.close()
\ No newline at end of file
+        # only close connections opened here
+        if owns_connection:
+            conn.close()
\ No newline at end of file
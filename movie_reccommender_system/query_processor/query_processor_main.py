@@ -9,11 +9,10 @@
 import os
 import sqlite3
 import logging
-from pydantic import BaseModel
 from typing import List, Tuple, Dict
 from dotenv import load_dotenv
 from movie_reccommender_system.query_processor import query_preprocessing
-from movie_reccommender_system.response_basemodel_validator.query_processor_model import QueryParser, SingleRowMovieRecord
+from movie_reccommender_system.response_basemodel_validator.query_processor_model import QueryParser, SingleRowMovieRecord, Intent
 load_dotenv()
 # define basic config
 logging.basicConfig(
@@ -71,9 +70,9 @@ class MovielensQueryProcessor:
             avg_rating_value=float(round(avg_rating, 3)) if avg_rating is not None else None
             # define num rating value
             num_ratings_value=int(num_ratings) if num_ratings is not None else None
-            # append one SingleRowMovieRecord
+            # append one SingleRowMovieRecord -> values are already typed by sqlite, skip validation
             output_response_list.append(
-                SingleRowMovieRecord(
+                SingleRowMovieRecord.model_construct(
                     title=title,
                     year=year if year else None,
                     avg_rating=avg_rating_value,
@@ -316,14 +315,16 @@ class MovielensQueryProcessor:
 
         """
         logger.info(f"Dispatcher: intent: {parsed.intent}, limit: {limit}")
+        # intent as Intent enum (plain names are accepted too)
+        intent = Intent.coerce(parsed.intent)
         # switch on intent
-        if parsed.intent == "GET_DETAILS":
+        if intent == Intent.GET_DETAILS:
             return self.run_get_movie_details(parsed, limit=min(limit, parsed.top_n or limit))
-        if parsed.intent == "RECOMMEND_BY_FILTER":
+        if intent == Intent.RECOMMEND_BY_FILTER:
             return self.run_recommend_movie_by_filter(parsed, limit=min(limit, parsed.top_n or limit))
-        if parsed.intent == "TOP_N":
+        if intent == Intent.TOP_N:
             return self.run_top_n_query(parsed)
-        if parsed.intent == "SIMILAR_MOVIES":
+        if intent == Intent.SIMILAR_MOVIES:
             return self.run_similar_movie_genres(parsed, limit=min(limit, parsed.top_n or limit))
 
         logger.info(f"Dispatcher: UNKNOWN intent -> returning empty list")
@@ -349,8 +350,8 @@ class MovielensQueryProcessor:
         # get raw_results - 
         logger.info(f"Executing the query procesor to sample the raw_results.")
         raw_results=self.query_excutor(parsed, limit=min(limit, parsed.top_n or limit))
-        # intent string
-        intent_value = parsed.intent or ""
+        # intent name string for downstream stages
+        intent_value = Intent.coerce(parsed.intent).name if parsed.intent else ""
 
         # slots dictionary
         slots_dict = {}
@@ -368,14 +369,12 @@ class MovielensQueryProcessor:
         # adapt results into expected schema
         final_results = []
         for index, result_row in enumerate(raw_results or [], start=1):
-            # check if the row is a Pydantic model, convert to a dict; 
             # if it's already a dict, use as-is
-            if isinstance(result_row, BaseModel):
-                row_dict = result_row.dict()
-            elif isinstance(result_row, dict):
+            if isinstance(result_row, dict):
                 row_dict = result_row
             else:
-                # fallback: try attribute access for known fields
+                # Pydantic rows (and other objects): read the known fields directly,
+                # no per-row model_dump/serialisation pass
                 row_dict = {
                     "title": getattr(result_row, "title", ""),
                     "year": getattr(result_row, "year", None),
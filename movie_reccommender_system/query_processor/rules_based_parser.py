@@ -2,7 +2,7 @@
 import re
 import logging
 from movie_reccommender_system.query_processor import query_preprocessing
-from movie_reccommender_system.response_basemodel_validator.query_processor_model import QueryParser
+from movie_reccommender_system.response_basemodel_validator.query_processor_model import QueryParser, Intent
 # basic log info 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +39,17 @@ WORD_NUMBERs = {
     "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
     "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,}
 
+# precompiled genre alternation -> longest keys first so 'science fiction'/'film-noir' win
+_GENRE_PATTERN = re.compile(
+    "|".join(re.escape(key) for key in sorted(KNOWN_GENRES, key=len, reverse=True)))
+
+# precompiled intent rules, checked in order -> first match wins
+_INTENT_PATTERNS = (
+    (re.compile(r"tell me about|who directed|who starred"), Intent.GET_DETAILS),
+    (re.compile(r"movies like"), Intent.SIMILAR_MOVIES),
+    (re.compile(r"(?<!\S)top(?!\S)"), Intent.TOP_N),
+    (re.compile(r"recommend"), Intent.RECOMMEND_BY_FILTER),)
+
 
 
 # parse user textGET_DE
@@ -76,11 +87,19 @@ def user_query_parser(text: str):
     logger.info(f"Collecting the title from text..")
     title = get_title_from_text(text)
 
-    # check phrase 'tell me about' for details intent
-    if "tell me about" in convert_to_lowercase or "who directed" in convert_to_lowercase or "who starred" in convert_to_lowercase:
-        # build a QueryParser for GET_DETAILS
+    # detect the intent with the precompiled rules
+    for pattern, intent in _INTENT_PATTERNS:
+        if pattern.search(convert_to_lowercase):
+            break
+    else:
+        # presence of filters also means recommend, else unknown
+        intent = Intent.RECOMMEND_BY_FILTER if (genres or year or year_from) else Intent.UNKNOWN
+
+    # slots come from free user text -> keep full QueryParser validation
+    # build a QueryParser for GET_DETAILS
+    if intent == Intent.GET_DETAILS:
         return QueryParser(
-            intent="GET_DETAILS",
+            intent=intent,
             raw_text=raw_text,
             title=title,
             genres=[],
@@ -90,11 +109,10 @@ def user_query_parser(text: str):
             min_rating=minimal_ratings or None,
             top_n=top_n_value,)
 
-    # check phrase 'movies like' for similar movies intent
-    if "movies like" in convert_to_lowercase:
-        # build a QueryParser for SIMILAR_MOVIES
+    # build a QueryParser for SIMILAR_MOVIES
+    if intent == Intent.SIMILAR_MOVIES:
         return QueryParser(
-            intent="SIMILAR_MOVIES",
+            intent=intent,
             raw_text=raw_text,
             title=title,
             genres=[],
@@ -104,11 +122,10 @@ def user_query_parser(text: str):
             min_rating=minimal_ratings or None,
             top_n=top_n_value,)
 
-    # check for 'top' presence for top-n intent
-    if "top" in query_preprocessing.split_text_into_words_corpus(convert_to_lowercase):
-        # build a QueryParser for TOP_N
+    # build a QueryParser for TOP_N
+    if intent == Intent.TOP_N:
         return QueryParser(
-            intent="TOP_N",
+            intent=intent,
             raw_text=raw_text,
             title="",
             genres=genres,
@@ -120,11 +137,10 @@ def user_query_parser(text: str):
             top_n=top_n_value,
             sort="rating",)
 
-    # check for recommend intent or presence of filters
-    if "recommend" in convert_to_lowercase or genres or year or year_from:
-        # build a QueryParser for RECOMMEND_BY_FILTER
+    # build a QueryParser for RECOMMEND_BY_FILTER
+    if intent == Intent.RECOMMEND_BY_FILTER:
         return QueryParser(
-            intent="RECOMMEND_BY_FILTER",
+            intent=intent,
             raw_text=raw_text,
             title="",
             genres=genres,
@@ -137,7 +153,7 @@ def user_query_parser(text: str):
 
     # fallback to unknown if no rules matched
     return QueryParser(
-        intent="UNKNOWN",
+        intent=Intent.UNKNOWN,
         raw_text=raw_text,)
 
 
@@ -352,24 +368,18 @@ def get_genres_from_text(text: str):
     # make a lower-case copy
     convert_to_lowercase = query_preprocessing.covnert_text_to_lower_case(text)
 
-    # start an empty list for found genres
+    # start an empty list for found genres, plus a set for O(1) duplicate checks
     found_genres_list = []
-
-    # check multi-word genre first e.g. 'science fiction'
-    if "science fiction" in convert_to_lowercase:
-        # append canonical form if present
-        found_genres_list.append(KNOWN_GENRES["science fiction"])
-
-    # check for single-word or dash forms by simple substring match with word boundaries approximated - loop over the keys in KNOWN_GENRES
-    for key, value in KNOWN_GENRES.items():
-        # skipping the 'science fiction' here because we already handled it
-        if key == "science fiction":
-            continue
-        # if the key appears as a substring surrounded by spaces or at edges then accept it
-        if key in convert_to_lowercase:
-            # append canonical form if not already present
-            if value not in found_genres_list:
-                found_genres_list.append(value)
+    seen_genres = set()
+
+    # one scan over the text for every genre key (multi-word and dash forms included)
+    for match in _GENRE_PATTERN.finditer(convert_to_lowercase):
+        # map to canonical form
+        value = KNOWN_GENRES[match.group(0)]
+        # append canonical form if not already present
+        if value not in seen_genres:
+            seen_genres.add(value)
+            found_genres_list.append(value)
 
     # return the list of unique canonical genre names
     return found_genres_list
@@ -1,9 +1,9 @@
 """ LLM Client - meta-llama/Llama-3.2-3B-Instruct """
 import os
 import time
-import json
 import torch
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 from transformers import pipeline
@@ -36,6 +36,49 @@ logger=logging.getLogger("LLM_Client_Responder")
 #     pipe = None
 
 
+# load the text-generation pipeline once per (model, token) for the whole process
+@lru_cache(maxsize=4)
+def get_text_generation_pipeline(
+        model_id: str, 
+        hf_token: Optional[str] = None):
+    """Function to build (once) and return the HF text-generation pipeline.
+        Later calls with the same model/token reuse the loaded weights instead of reloading them.
+
+    Args:
+        model_id (str): HF model id to load (e.g. meta-llama/Llama-3.2-3B-Instruct).
+        hf_token (str, optional): HF access token for gated models.
+
+    Returns:
+        transformers.Pipeline: the cached text-generation pipeline.
+    """
+    logger.info("Loading text-generation pipeline for %s..", model_id)
+    text_generation_pipe = pipeline(
+        "text-generation",
+        model=model_id,
+        token=hf_token,
+        torch_dtype=torch.float32,
+        device_map="auto",)
+    logger.info("%s model successfully loaded.", model_id)
+    return text_generation_pipe
+
+
+# build the HF inference client once per (provider, token)
+@lru_cache(maxsize=4)
+def get_inference_client(
+        provider: str, 
+        hf_token: Optional[str] = None) -> InferenceClient:
+    """Function to build (once) and return the HF InferenceClient for a provider.
+
+    Args:
+        provider (str): Inference provider (e.g. "novita").
+        hf_token (str, optional): HF access token.
+
+    Returns:
+        InferenceClient: the cached client, reusing its HTTP session across requests.
+    """
+    return InferenceClient(provider=provider, api_key=hf_token)
+
+
 
 # create the main function that wires Points 1–5 + conversational rendering
 def generate_query_response(
@@ -53,16 +96,14 @@ def generate_query_response(
     if not req.executor_payload:
         raise ValueError("executor_payload is required (intent, slots, results).")
 
-    # start total timer & start preprocessing timer
-    start_time, preprocessing_timer = time.time(), time.time()
+    # start the shared total + preprocessing timer (monotonic, ns)
+    start_time = time.perf_counter_ns()
 
     logger.info(f"Normalising results..")
     normalised_data = normalise_query_output(req.executor_payload, max_results=max(5, req.max_results))
     # build context
     logger.info(f"Building the context..")
     context = extract_compact_context(normalised_data, max_filters_length=160)
-    # add the titles list for convenience and potential future use
-    context["titles"] = [r.get("title") for r in normalised_data.get("results", []) if r.get("title")]
     # apply edge handling
     normalised_data, context = apply_edgecase_handling(
         normalised_data,
@@ -71,7 +112,7 @@ def generate_query_response(
         min_count_threshold=50,
         diversify=req.diversify)
     # define stop preprocessing timer
-    preprocessing_end_time = time.time()
+    preprocessing_end_time = time.perf_counter_ns()
 
     # extract fields we need to render
     intent = normalised_data.get("intent", "")
@@ -89,21 +130,26 @@ def generate_query_response(
         tone="concise", 
         max_items=5)
     
-    logger.info(f"Calling llm -Llama-3.2-3B-Instruct..")
-    llm_query_response=run_hf_llm_inference_client(
-        system_prompt=system_prompt,
-        user_message=user_message, 
-        model_id=model_id, 
-        provider="novita",
-        hf_token=hf_token,
-        temperature=getattr(req, "temperature", 0.3),
-        top_p=getattr(req, "top_p", 0.9),
-        max_new_tokens=getattr(req, "max_new_tokens", 350))
+    # no results -> the deterministic answer already says so, skip the generation call
+    if not results:
+        logger.info("No results after edge handling, skipping the LLM call.")
+        llm_query_response = ""
+    else:
+        logger.info(f"Calling llm -Llama-3.2-3B-Instruct..")
+        llm_query_response=run_hf_llm_inference_client(
+            system_prompt=system_prompt,
+            user_message=user_message, 
+            model_id=model_id, 
+            provider="novita",
+            hf_token=hf_token,
+            temperature=getattr(req, "temperature", 0.3),
+            top_p=getattr(req, "top_p", 0.9),
+            max_new_tokens=getattr(req, "max_new_tokens", 350))
     # get the answer text after LLM
     answer_text=llm_query_response if llm_query_response else fallback_answer
 
-    # build the final response
-    response = llm_response_model.AnswerResponse(
+    # build the final response -> every field is built above, skip re-validation
+    response = llm_response_model.AnswerResponse.model_construct(
         intent=intent,
         slots=slots,
         results=results,
@@ -111,8 +157,8 @@ def generate_query_response(
         prompt_preview=system_prompt,
         answer=answer_text,
         timing_ms={
-            "preproc": int((preprocessing_end_time - start_time) * 1000),
-            "total": int((time.time() - preprocessing_timer) * 1000),},
+            "preproc": (preprocessing_end_time - start_time) // 1_000_000,
+            "total": (time.perf_counter_ns() - start_time) // 1_000_000,},
         llm={"provider": "local-transformers",
             "model": "meta-llama/Llama-3.2-3B-Instruct",
             "params": {
@@ -122,6 +168,7 @@ def generate_query_response(
                 "do_sample": getattr(req, "do_sample", True),
             },
             "used_fallback": not bool(llm_query_response),
+            "skipped_empty": not results,
         },)
     # return the response
     return response
@@ -153,10 +200,9 @@ def run_hf_llm_inference_client(
         str: Assistant text, or "" if the request fails.
     """
     try:
-        hf_inference_client = InferenceClient(
-            provider=provider,
-            api_key=hf_token)
-        logger.info("HF InferenceClient (novita) is ready.")
+        # reuse the cached client for this provider/token
+        hf_inference_client = get_inference_client(provider, hf_token)
+        logger.info("HF InferenceClient (%s) is ready.", provider)
     except Exception as e:
         logger.error(f"Failed to initialize InferenceClient: {e}")
         return ""
@@ -189,6 +235,8 @@ def run_hf_llm_inference_client(
 # llm client infernce using pipe as text-generation
 def run_hf_llm_client_with_text_generation_pipe(
     system_prompt: str,
+    model_id: str = "meta-llama/Llama-3.2-3B-Instruct",
+    hf_token: Optional[str] = None,
     temperature: float = 0.3,
     top_p: float = 0.9,
     max_new_tokens: int = 350,
@@ -196,13 +244,15 @@ def run_hf_llm_client_with_text_generation_pipe(
     """Funciton to run the LLM inference using the Llama 3.2 3B Instruct model via the Hugging Face Transformers pipeline.
 
         Handles:
-        - Lazy loading of the model (loads once globally)
+        - Lazy loading of the model (loads once per process via get_text_generation_pipeline)
         - Safe text generation using Hugging Face's pipeline
         - Clear parameter control for creativity, sampling, and tone
 
     Args:
         prompt_text (str): text to generate a response for.
         system_prompt (str, optional): system prompt after prompt compilation.
+        model_id (str, optional): HF model id for the cached pipeline.
+        hf_token (str, optional): HF access token for gated models.
         temperature (float, optional): Controls randomness in text generation.
             - Low (0.1–0.4): factual, deterministic.
             - Medium (0.5–0.7): balanced tone.
@@ -217,14 +267,13 @@ def run_hf_llm_client_with_text_generation_pipe(
         str:
             The generated model response as plain text. Returns an empty string on failure.
     """
-    # initalise the pipeline
-    global pipe
-
     # prepare the structured messages (Llama 3 uses chat-style input)
     messages = [{"role": "user", "content": system_prompt},]
 
     logger.info("Generating response using Llama 3.2-3B-Instruct...")
     try:
+        # cached pipeline -> weights are loaded only on the first call
+        pipe = get_text_generation_pipeline(model_id, hf_token)
         # run inference using the pipeline
         outputs = pipe(
             messages,
@@ -349,4 +398,5 @@ def run_hf_llm_client_with_text_generation_pipe(
 #           HUGGINGFACE_HUB_TOKEN)
 #     # Print the output with Unicode preserved (no \u escapes) and pretty formatting
 #     # print(res)
-#     print(json.dumps(res.model_dump(), indent=4, ensure_ascii=False))
\ No newline at end of file
+#     import orjson
+#     print(orjson.dumps(res.model_dump(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
\ No newline at end of file
@@ -1,5 +1,9 @@
 """ Script to build the summary field from normlaised data from LLM Preprocessing (llm_preprocessing.py)"""
+import re
+import sys
 import logging
+from functools import lru_cache
+from typing import NamedTuple, Optional
 # basic log info 
 logging.basicConfig(
     level=logging.INFO,
@@ -7,6 +11,29 @@ logging.basicConfig(
 # deifne single logger for context builder
 logger=logging.getLogger("LLM_Context_Builder")
 
+# genre separators -> pipes or commas, split in one pass
+GENRE_SEPARATOR = re.compile(r"[|,]")
+
+# separator between the parts of the filters line
+FILTER_SEPARATOR = "; "
+
+# intent -> hint text at the start of the filters line
+INTENT_HINT = {
+    "RECOMMEND_BY_FILTER": "recommendations by filters",
+    "RECOMMEND": "recommendations",
+    "TOP_N": "top titles",
+    "SIMILAR_MOVIES": "similar titles",
+    "GET_DETAILS": "title details",}
+
+# slot-derived part of the compact context (immutable -> safe to share from the memo)
+class CompactContextFields(NamedTuple):
+    """Slot-derived context strings built by build_context_fields()."""
+    seed_title: Optional[str]
+    filters_text: Optional[str]
+    time_window: Optional[str]
+    rating_bounds: Optional[str]
+
+
 # Extract compact context object
 def extract_compact_context(
         normalised_data, 
@@ -23,9 +50,13 @@ def extract_compact_context(
         filters_text: str|None
         time_window: str|None
         rating_bounds: str|None
+        titles: list
+        intent_key: str (stripped, upper-cased intent shared by the later stages)
     """
-    # extract intent
+    # extract intent and normalise it once for every later stage
     intent = normalised_data.get("intent")
+    # interned -> dict lookups on the intent tables hit by pointer equality
+    intent_key = sys.intern(intent.strip().upper()) if isinstance(intent, str) else ""
     # extract slots dictionary
     slots = normalised_data.get("slots", {})
     # extract results list
@@ -34,35 +65,73 @@ def extract_compact_context(
     # count number of results
     result_count = len(results)
 
+    # hashable view of the slots (lists -> tuples) so repeat filters hit the memo
+    slots_key = tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value) for key, value in slots.items()))
+    try:
+        fields = build_context_fields(intent_key, slots_key, max_filters_length)
+    except TypeError:
+        # unhashable slot values -> build without the memo
+        fields = build_context_fields.__wrapped__(intent_key, slots_key, max_filters_length)
+
+    # collect all movie titles from results
+    titles = [r.get("title") for r in results if r.get("title")]
+
+    logger.info("Successfully comleting the LLM Context builder tasks..")
+    # fresh dict per call -> callers may edit the context downstream
+    return {
+        "result_count": result_count,
+        "seed_title": fields.seed_title,
+        "filters_text": fields.filters_text,
+        "time_window": fields.time_window,
+        "rating_bounds": fields.rating_bounds,
+        "titles": titles,
+        "intent_key": intent_key,}
+
 
-    logger.info(f"Handling the time window.")
+# memoised slot-derived context strings
+@lru_cache(maxsize=1024)
+def build_context_fields(
+        intent, 
+        slots_key, 
+        max_filters_length=140):
+    """Function to build the slot-derived context strings, memoised on (intent, slots, max length).
+
+    Args:
+        intent (str): Incoming intent such as TOP_N.
+        slots_key (tuple): Sorted (key, value) slot pairs, list values as tuples.
+        max_filters_length (int): Max length of the filters text.
+
+    Returns:
+        CompactContextFields: (seed_title, filters_text, time_window, rating_bounds).
+    """
+    # rebuild the slots dict with list values restored
+    slots = {key: list(value) if isinstance(value, tuple) else value for key, value in slots_key}
+
+    # no-filter queries -> skip the slot builders, only the intent hint is left
+    if not slots:
+        filters_text = build_filters_text(intent, slots, None, None, max_length=max_filters_length)
+        return CompactContextFields(None, filters_text, None, None)
+
+    logger.info("Handling the time window.")
     time_window_text = build_time_window(slots)
 
-    logger.info(f"Handling the rating bounding phrase.")
+    logger.info("Handling the rating bounding phrase.")
     rating_text = build_rating_bounds(slots)
 
-    logger.info(f"Handling the title string.")
+    logger.info("Handling the title string.")
     seed_title = to_str_safe(slots.get("title"))
 
-    logger.info(f"Building tghe final filter text.")
+    logger.info("Building tghe final filter text.")
     filters_text = build_filters_text(
         intent, 
         slots, 
         time_window_text, 
         rating_text, 
+        seed_title=seed_title,
         max_length=max_filters_length)
 
-    # collect all movie titles from results
-    titles = [r.get("title") for r in results if r.get("title")]
-
-    logger.info(f"Successfully comleting the LLM Context builder tasks..")
-    return {
-        "result_count": result_count,
-        "seed_title": seed_title,
-        "filters_text": filters_text,
-        "time_window": time_window_text,
-        "rating_bounds": rating_text,
-        "titles": titles,}
+    return CompactContextFields(seed_title, filters_text, time_window_text, rating_text)
 
 
 
@@ -101,14 +170,13 @@ def normalize_slot_genres(slots):
     # If nothing present, return empty list
     if raw_slot is None:
         return []
-    # If string, replace pipes with commas and split
+    # If string, split on pipes or commas
     if isinstance(raw_slot, str):
-        parts = raw_slot.replace("|", ",").split(",")
         # Strip whitespace and drop empties
-        return [p.strip() for p in parts if p.strip()]
+        return [sys.intern(p) for p in map(str.strip, GENRE_SEPARATOR.split(raw_slot)) if p]
     # If list, convert each to string and strip
     if isinstance(raw_slot, list):
-        return [str(p).strip() for p in raw_slot if str(p).strip()]
+        return [sys.intern(p) for p in map(str.strip, map(str, raw_slot)) if p]
     # Otherwise return empty list
     return []
 
@@ -127,7 +195,11 @@ def build_time_window(slots):
 
     Returns:
         cleanned year value for LLM context. None is no slot for year.
+        Always a non-empty str or None -> callers can use a plain truthy check.
     """
+    # no slots at all -> no time window
+    if not slots:
+        return None
     # read slot values
     year = slots.get("year")
     start_year = slots.get("start_year")
@@ -159,28 +231,32 @@ def build_rating_bounds(slots):
         exact rating -> "= 5.0"
 
     Args: 
-        slots (dict): Containung the rating values.
+        slots (dict): Containung the rating values, already coerced to float by normalize_slots().
 
     Returns:
         cleanned rating value for LLM context. None is no slot for rating.
+        Always a non-empty str or None -> callers can use a plain truthy check.
     """
-    # read slot values
+    # no slots at all -> no rating bounds
+    if not slots:
+        return None
+    # read slot values (numeric after normalisation -> format directly, no re-parsing)
     min_rating = slots.get("min_rating")
     max_rating = slots.get("max_rating")
     exact_rating = slots.get("rating")
 
     # if exact rating provided
     if exact_rating is not None:
-        return f"= {round(float(exact_rating), 1)}"
+        return f"= {exact_rating:.1f}"
     # if both min and max provided
     if min_rating is not None and max_rating is not None:
-        return f"between {round(float(min_rating), 1)} and {round(float(max_rating), 1)}"
+        return f"between {min_rating:.1f} and {max_rating:.1f}"
     # if only min rating provided
     if min_rating is not None:
-        return f"≥ {round(float(min_rating), 1)}"
+        return f"≥ {min_rating:.1f}"
     # if only max rating provided
     if max_rating is not None:
-        return f"≤ {round(float(max_rating), 1)}"
+        return f"≤ {max_rating:.1f}"
     return None
 
 
@@ -190,6 +266,7 @@ def build_filters_text(
         slots, 
         time_window_text, 
         rating_text, 
+        seed_title=None,
         max_length=140):
     """Function to combine filters into one short text string.
         Order:
@@ -204,6 +281,7 @@ def build_filters_text(
         slots, 
         time_window_text, 
         rating_text,
+        seed_title (str|None): Seed title already cleaned by the caller; read from slots when None.
         max_length (int): Default to 140.
 
     Returns:
@@ -212,36 +290,40 @@ def build_filters_text(
     # list to store the each text as parts
     parts = []
 
-    # add intent hint based on type
-    if to_str_safe(intent) in {"RECOMMEND_BY_FILTER"}:
-        parts.append("recommendations by filters")
-    elif to_str_safe(intent) == "TOP_N":
-        parts.append("top titles")
-    elif to_str_safe(intent) == "SIMILAR_MOVIES":
-        parts.append("similar titles")
-    elif to_str_safe(intent) == "GET_DETAILS":
-        parts.append("title details")
+    # add intent hint based on type -> normalise once, one dict lookup
+    intent_key = intent.strip().upper() if isinstance(intent, str) else None
+    intent_hint = INTENT_HINT.get(intent_key)
+    if intent_hint:
+        parts.append(intent_hint)
 
     # add genres from slots
     genres_list = normalize_slot_genres(slots)
     if genres_list:
         parts.append("genres=" + ", ".join(genres_list))
 
-    # add time window if present
-    if to_str_safe(time_window_text):
+    # add time window if present (build_time_window gives a non-empty str or None)
+    if time_window_text:
         parts.append(time_window_text)
 
-    # add rating bounds if present
-    if to_str_safe(rating_text):
+    # add rating bounds if present (build_rating_bounds gives a non-empty str or None)
+    if rating_text:
         parts.append(rating_text)
 
-    # add seed title if present
-    seed_title = to_str_safe(slots.get("title"))
+    # add seed title if present (callers normally pass the one they already cleaned)
+    if seed_title is None:
+        seed_title = to_str_safe(slots.get("title"))
     if seed_title:
         parts.append(f'title="{seed_title}"')
 
-    # join all parts with semicolons
-    text = "; ".join(parts)
+    # keep parts only until the joined length passes max_length -> later parts would be trimmed anyway
+    kept_parts, joined_length = [], -len(FILTER_SEPARATOR)
+    for part in parts:
+        kept_parts.append(part)
+        joined_length += len(FILTER_SEPARATOR) + len(part)
+        if joined_length > max_length:
+            break
+    # join the kept parts with semicolons
+    text = FILTER_SEPARATOR.join(kept_parts)
 
     # if too long, trim and add ellipsis
     if len(text) > max_length:
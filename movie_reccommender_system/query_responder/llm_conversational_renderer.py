@@ -1,6 +1,7 @@
 """ Script to render the conversation tasks. Best for small text use cases.
 Still need to work on it - as this is plan B
 """
+import sys
 import logging
 from typing import Dict, List, Any, Optional
 # basic log info 
@@ -18,7 +19,7 @@ def render_conversational_answer(
         results: List[Dict[str, Any]],
         max_items: int = 5):
     """Function to render a short, conversational answer for a given intent and results.
-    Supports: TOP_N, RECOMMEND_BY_FILTER, GET_DETAILS, SIMILAR_MOVIES.
+    Supports: TOP_N, RECOMMEND_BY_FILTER, RECOMMEND, GET_DETAILS, SIMILAR_MOVIES.
     Falls back gracefully if intent is unknown or results are empty.
 
     Args:
@@ -31,58 +32,76 @@ def render_conversational_answer(
         str: Final conversational response.
     """ 
     
-    # normalize intent to uppercase
-    intent_key = (intent or "").upper()
+    # reuse the intent key normalised by the context builder, else normalize intent to uppercase
+    intent_key = context.get("intent_key") or sys.intern((intent or "").upper())
 
     # clip results to the requested maximum
     rows = results[:max_items]
 
-    # build per-movie sentences (used by GET_DETAILS)
-    logger.info("Formatting the movie sentence.")
-    sentences = [format_movie_sentence(r) for r in rows]
-
     # extract a human hint from context filters, if present
     hint = context.get("filters_text")
 
-    # GET_DETAILS: usually a single item
-    if intent_key == "GET_DETAILS":
-        if rows:
-            # if we have a row, return a single clean sentence
-            return sentences[0]
-        # if no row is available, say we could not find details
-        return "I could not find details for that title."
-
-    # SIMILAR_MOVIES: mention seed and up to 3 recommendations
-    if intent_key == "SIMILAR_MOVIES":
-        seed = context.get("seed_title")
-        title_list = [r.get("title") for r in rows if r.get("title")]
-        logger.info("Joining the title list for similar movies..")
-        if title_list:
-            joined = natural_join(title_list[:3])  # keep short for this intent
-            if seed:
-                return f"If you liked {seed}, you might also enjoy {joined}."
-            return f"You might also enjoy {joined}."
-        return "I could not find similar movies to recommend."
-
-    # TOP_N / RECOMMEND_BY_FILTER: list ALL clipped rows (no ellipsis)
-    if intent_key in {"TOP_N", "RECOMMEND_BY_FILTER"}:
-        # no matches: suggest widening filters
-        if not rows:
-            return "I could not find any matches. Try lowering the rating or widening the year range."
-
-        # build highlights from ALL rows we decided to show (rows already clipped by max_items)
-        logger.info("Joining the formatted movie briefs for highlights..")
-        highlights = natural_join([format_movie_brief(r) for r in rows])
-
-        # include filters hint when available
-        if hint:
-            return f"I found {len(rows)} title(s) matching your filters ({hint}): {highlights}."
-        return f"I found {len(rows)} title(s): {highlights}."
+    # one dict lookup picks the intent renderer; unknown intents use the fallback
+    return INTENT_RENDERERS.get(intent_key, render_fallback_answer)(rows, hint, context)
 
-    # fallback: unknown intent but we have some rows
+
+# GET_DETAILS: usually a single item
+def render_details_answer(
+        rows: List[Dict[str, Any]],
+        hint: Optional[str],
+        context: Dict[str, Any]):
+    """Function to render the GET_DETAILS answer from the clipped rows."""
+    if rows:
+        # if we have a row, format only that one sentence
+        return format_movie_sentence(rows[0])
+    # if no row is available, say we could not find details
+    return "I could not find details for that title."
+
+
+# SIMILAR_MOVIES: mention seed and up to 3 recommendations
+def render_similar_answer(
+        rows: List[Dict[str, Any]],
+        hint: Optional[str],
+        context: Dict[str, Any]):
+    """Function to render the SIMILAR_MOVIES answer from the clipped rows."""
+    seed = context.get("seed_title")
+    # one lookup per row for the non-empty titles
+    titles = [title for r in rows if (title := r.get("title"))]
+    if titles:
+        joined = natural_join(titles[:3])  # keep short for this intent
+        if seed:
+            return f"If you liked {seed}, you might also enjoy {joined}."
+        return f"You might also enjoy {joined}."
+    return "I could not find similar movies to recommend."
+
+
+# TOP_N / RECOMMEND*: list ALL clipped rows (no ellipsis)
+def render_top_n_answer(
+        rows: List[Dict[str, Any]],
+        hint: Optional[str],
+        context: Dict[str, Any]):
+    """Function to render the TOP_N / RECOMMEND answer from the clipped rows."""
+    # no matches: suggest widening filters
+    if not rows:
+        return "I could not find any matches. Try lowering the rating or widening the year range."
+
+    # build highlights from ALL rows we decided to show (rows already clipped by max_items)
+    logger.debug("Joining %d movie briefs for highlights..", len(rows))
+    highlights = natural_join([format_movie_brief(r) for r in rows])
+
+    # include filters hint when available -> one format for both shapes
+    filters_part = f" matching your filters ({hint})" if hint else ""
+    return f"I found {len(rows)} title(s){filters_part}: {highlights}."
+
+
+# fallback: unknown intent
+def render_fallback_answer(
+        rows: List[Dict[str, Any]],
+        hint: Optional[str],
+        context: Dict[str, Any]):
+    """Function to render a generic answer for intents without a dedicated renderer."""
     if rows:
-        logger.info("Joining the first two titles for fallback intent..")
-        first_two = natural_join([r.get("title") for r in rows[:2] if r.get("title")])
+        first_two = natural_join([title for r in rows[:2] if (title := r.get("title"))])
         if hint:
             return f"Here are the matches for your filters ({hint}): {first_two}."
         return f"Here are the matches: {first_two}."
@@ -90,98 +109,13 @@ def render_conversational_answer(
     return "No matching movies found."
 
 
-
-############### old version ####################
-def render_conversational_answer_old_version(
-        intent: str, 
-        context: Dict[str, Any], 
-        results: List[Dict[str, Any]], 
-        max_items: int = 5) :
-    """Function to render a short, conversational answer for a given intent and results.
-            Supports: TOP_N, RECOMMEND_BY_FILTER, GET_DETAILS, SIMILAR_MOVIES.
-            Falls back gracefully if intent is unknown or results are empty.
-
-    Args:
-        intent (str): Incoming intents.
-        context (dict): Incoming context after context builder.
-        reuslts (list): containing the results after normalised data.
-        max_items (int): Default to 5.
-
-    Returns:
-        Final conversation response.
-    """
-    # normalize intent to uppercase
-    intent_key = (intent or "").upper()
-    # clip results to the requested maximum
-    rows = results[:max_items]
-    # build per-movie sentences
-    logger.info(f"Formatting the movie sentence.")
-    sentences = [format_movie_sentence(r) for r in rows]
-    # extract a human hint from context filters, if present
-    hint = context.get("filters_text")
-
-    # handle GET_DETAILS: usually a single item
-    if intent_key == "GET_DETAILS":
-        # if we have a row, return a single clean sentence
-        if rows:
-            return sentences[0]
-        # if no row is available, say we could not find details
-        return "I could not find details for that title."
-
-    # handle SIMILAR_MOVIES: mention seed and 2–3 recommendations
-    if intent_key == "SIMILAR_MOVIES":
-        # read the seed title from context
-        seed = context.get("seed_title")
-        # extract titles from available rows
-        title_list = [r.get("title") for r in rows if r.get("title")]
-        # if we have titles, produce a short one-liner
-        logger.info(f"Joining the title in list..")
-        if title_list:
-            # join up to three titles
-            joined = natural_join(title_list[:3])
-            # if we know the seed, mention it
-            if seed:
-                return f"If you liked {seed}, you might also enjoy {joined}."
-            # if seed is unknown, just present the recommendations
-            return f"You might also enjoy {joined}."
-        # if no titles available, say none found
-        return "I could not find similar movies to recommend."
-
-    # handle TOP_N / RECOMMEND* intents: quick count + highlights
-    if intent_key in {"TOP_N", "RECOMMEND_BY_FILTER"}:
-        # If there are no rows, offer a gentle suggestion
-        if not rows:
-            return "I could not find any matches. Try lowering the rating or widening the year range."
-        # build a short highlights line from the first two rows using the brief formatter
-        logger.info(f"Joining the title in list..")
-        highlights = natural_join([format_movie_brief(r) for r in rows[:2]])
-        # compute how many more items we have beyond the highlights
-        more_count = max(len(rows) - 2, 0)
-        # If we have a hint and more items, include both
-        if hint and more_count > 0:
-            return f"I found {len(rows)} title(s) matching your filters ({hint}): {highlights}, and {more_count} more."
-        # if we only have a hint, include it
-        if hint:
-            return f"I found {len(rows)} title(s) matching your filters ({hint}): {highlights}."
-        # if no hint but more items remain, mention the count
-        if more_count > 0:
-            return f"I found {len(rows)} title(s): {highlights}, and {more_count} more."
-        # otherwise report what we have
-        return f"I found {len(rows)} title(s): {highlights}."
-
-    # fallback for unknown intents with some rows
-    if rows:
-        
-        # join the first two titles as a quick answer
-        logger.info(f"Joining the title in list..")
-        first_two = natural_join([r.get("title") for r in rows[:2] if r.get("title")])
-        # if we have a hint, include it
-        if hint:
-            return f"Here are the matches for your filters ({hint}): {first_two}."
-        # otherwise just present the titles
-        return f"Here are the matches: {first_two}."
-    # if nothing at all, generic no-result line
-    return "No matching movies found."
+# intent -> renderer dispatch table
+INTENT_RENDERERS = {
+    "GET_DETAILS": render_details_answer,
+    "SIMILAR_MOVIES": render_similar_answer,
+    "TOP_N": render_top_n_answer,
+    "RECOMMEND_BY_FILTER": render_top_n_answer,
+    "RECOMMEND": render_top_n_answer,}
 
 
 
@@ -201,9 +135,9 @@ def format_count(count: Optional[int]):
     # format millions with one decimal when needed
     if count >= 1_000_000:
         # compute millions with one decimal
-        text = f"{count/1_000_000:.1f}M"
-        # strip any trailing .0 for clean output
-        return text.rstrip("0").rstrip(".")
+        text = f"{count/1_000_000:.1f}"
+        # whole millions drop the ".0" before the suffix (e.g., 1M, 10M), others keep it (e.g., 1.5M)
+        return f"{text[:-2] if text.endswith('.0') else text}M"
     # format thousands as whole-k (e.g., 5k, 12k)
     if count >= 1000:
         # divide by 1000 and use integer part
@@ -241,20 +175,12 @@ def format_movie_brief(row: Dict[str, Any]):
     rating_part = f"{avg:.1f}★" if isinstance(avg, (int, float)) else "rating N/A"
     # build the count part with a simple thousands separator
     # count_part = f"{count:,} ratings" if isinstance(count, int) else "count N/A"
-    logger.info(f"Formatting the rating counts..")
     count_part = f"{format_count(count)} ratings" if isinstance(count, int) else "unknown rating count"
-    # start with title
-    base = title
-    # add year if present
+    # add year, genres, rating and count inside the same parentheses when the year is known
     if isinstance(year, int):
-        base += f" ({year}"
-        # add genres, rating, and count inside the same parentheses
-        base += f", {genres_text}, {rating_part}, {count_part})"
-    else:
-        # if no year, add everything after a dash
-        base += f" — {genres_text}, {rating_part}, {count_part}"
-
-    return base
+        return f"{title} ({year}, {genres_text}, {rating_part}, {count_part})"
+    # if no year, add everything after a dash
+    return f"{title} — {genres_text}, {rating_part}, {count_part}"
 
 
 
@@ -277,20 +203,23 @@ def format_movie_sentence(row: Dict[str, Any]):
     avg = row.get("avg_rating")
     count = row.get("num_ratings")
 
+    # check year/rating types once
+    has_year = isinstance(year, int)
+    has_avg = isinstance(avg, (int, float))
+
     # build genres text (fallback to 'Unknown genre')
     genres_text = "/".join(genres_list[:3]) if genres_list else "Unknown genre"
     # build rating text if available
-    rating_text = f"{avg:.1f}★" if isinstance(avg, (int, float)) else "an unrated"
+    rating_text = f"{avg:.1f}★" if has_avg else "an unrated"
     # build count text with separators if available
     # count_text = f"{count:,} ratings" if isinstance(count, int) else "unknown rating count"
-    logger.info(f"Formatting the rating counts..")
     count_text = f"{format_count(count)} ratings" if isinstance(count, int) else "unknown rating count"
 
     # build the core sentence parts
-    if isinstance(year, int) and isinstance(avg, (int, float)):
+    if has_year and has_avg:
         # full details case
         return f"{title} is an {genres_text} movie from {year} with a {rating_text} rating and {count_text}."
-    if isinstance(year, int):
+    if has_year:
         # no average rating case
         return f"{title} is an {genres_text} movie from {year} with {count_text}."
     # no year either
@@ -5,7 +5,9 @@
     - quality floor 
     - context annotations
 """
+import re
 import logging
+from collections import defaultdict, deque
 # basic log info 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,6 +15,9 @@ logging.basicConfig(
 # deifne single logger for context builder
 logger=logging.getLogger("LLM_Edgecase_Handler")
 
+# genre separators -> pipes or commas, split in one pass
+GENRE_SEPARATOR = re.compile(r"[|,]")
+
 
 # apply edge-case handling end-to-end
 def apply_edgecase_handling(
@@ -125,37 +130,38 @@ def detect_edge_cases(
     no_results = len(results) == 0
     # compute overflow flag
     overflow = len(results) > max_results
-    # compute sparse quality flag (many items with low counts or missing rating)
-    low_quality_count = sum(
-        1 for r in results
-        if r.get("avg_rating") is None or (isinstance(r.get("num_ratings"), int) and r.get("num_ratings") < min_count_threshold))
-    
+    # counters filled by a single pass over the results
+    low_quality_count = 0
+    thin_meta_count = 0
+    # build tuples (rating, count) to check duplicates
+    seen_pairs = set()
+    # compute ties possible flag (many items with identical rating/count)
+    ties_possible = False
+    # one scan -> each field read once per row
+    for r in results:
+        # bind the row getter once
+        g = r.get
+        ar = g("avg_rating")
+        nr = g("num_ratings")
+        # low quality -> missing rating or too few ratings
+        if ar is None or (isinstance(nr, int) and nr < min_count_threshold):
+            low_quality_count += 1
+        # thin metadata -> missing year or genres
+        if g("year") is None or not g("genres"):
+            thin_meta_count += 1
+        # one duplicate sort key is enough -> stop tracking pairs after it
+        if not ties_possible:
+            # a pair that does not grow the set is a duplicate sort key
+            seen_before = len(seen_pairs)
+            seen_pairs.add((ar, nr))
+            ties_possible = len(seen_pairs) == seen_before
+
     # decide if sparse quality exists (half or more items are low quality)
     sparse_quality = (len(results) > 0) and (low_quality_count >= max(1, len(results) // 2))
     # compute seed missing flag for SIMILAR_MOVIES
     seed_missing = (intent == "SIMILAR_MOVIES") and (not slots.get("title"))
-    # compute thin metadata flag (many items missing year or genres)
-    thin_meta_count = sum(1 for r in results if (r.get("year") is None or not r.get("genres")))
     # decide if thin metadata exists (half or more items are thin)
     thin_metadata = (len(results) > 0) and (thin_meta_count >= max(1, len(results) // 2))
-    # compute ties possible flag (many items with identical rating/count)
-    ties_possible = False
-    # build tuples (rating, count) to check duplicates
-    seen_pairs = set()
-    # track duplicates count
-    dup_pairs = 0
-    # iterate over results to detect duplicate sort keys
-    for r in results:
-        pair = (r.get("avg_rating"), r.get("num_ratings"))
-        if pair in seen_pairs:
-            dup_pairs += 1
-        else:
-            seen_pairs.add(pair)
-    
-    # if we have any duplicates, ties are possible
-    if dup_pairs > 0:
-        ties_possible = True
-
     # return all flags
     return {
         "no_results": no_results,
@@ -189,7 +195,7 @@ def make_simple_suggestions(slots):
     if genres_raw:
         # normalize to list
         if isinstance(genres_raw, str):
-            genres_list = [g.strip() for g in genres_raw.replace("|", ",").split(",") if g.strip()]
+            genres_list = [g for g in map(str.strip, GENRE_SEPARATOR.split(genres_raw)) if g]
         elif isinstance(genres_raw, list):
             genres_list = [str(g).strip() for g in genres_raw if str(g).strip()]
         else:
@@ -218,55 +224,43 @@ def diversify_and_cap(
         list[dict]: Diversified and capped list.
     """
     # group results by their primary genre (first genre in list)
-    by_genre = {}
+    by_genre = defaultdict(list)
     # iterate over results to build groups
     for row in results:
         # read list of genres
         genres_list = row.get("genres") or []
         # pick first genre as primary, or "Unknown" if none
         primary = genres_list[0] if genres_list else "Unknown"
-        # append row to that genre bucket
-        by_genre.setdefault(primary, []).append(row)
+        # append row to that genre bucket -> no throwaway list per row
+        by_genre[primary].append(row)
 
-    # create an ordered list of genre keys to iterate round-robin
-    genre_keys = list(by_genre.keys())
+    # queue of bucket iterators in first-seen genre order
+    buckets = deque(iter(bucket) for bucket in by_genre.values())
     # create output list
     picked_results = []
-    # use an index to walk within each genre list
-    index = 0
-    # continue until we hit the cap or run out of items
-    while len(picked_results) < max_results:
-        # track whether we added something in this round
-        added_in_round = False
-        # loop through each genre key
-        for g in genre_keys:
-            # get the list for this genre
-            bucket = by_genre.get(g, [])
-            # if the index is within this bucket, pick that item
-            if index < len(bucket):
-                picked_results.append(bucket[index])
-                added_in_round = True
-                # stop if we reached the cap
-                if len(picked_results) >= max_results:
-                    break
-             
-        # if no items were added in this round, we are done
-        if not added_in_round:
-            break
-        # move to next index for the next round
-        index += 1
+    # ids already picked -> reused by the fill step below
+    picked_ids = set()
+    # take one row from the front bucket, then rotate it to the back
+    while len(picked_results) < max_results and buckets:
+        bucket = buckets.popleft()
+        row = next(bucket, None)
+        # exhausted buckets are dropped, never revisited
+        if row is None:
+            continue
+        picked_results.append(row)
+        picked_ids.add(row.get("movieId"))
+        buckets.append(bucket)
 
     # if we still have fewer than max_results and there are leftovers, fill from the original list
     if len(picked_results) < max_results:
-        # Build a set of already picked ids to avoid duplicates
-        picked_ids = {p.get("movieId") for p in picked_results}
         # Iterate original results to fill remaining spots
         for row in results:
             if len(picked_results) >= max_results:
                 break
-            if row.get("movieId") not in picked_ids:
+            movie_id = row.get("movieId")
+            if movie_id not in picked_ids:
                 picked_results.append(row)
-                picked_ids.add(row.get("movieId"))
+                picked_ids.add(movie_id)
 
     # return final picked results
     return picked_results
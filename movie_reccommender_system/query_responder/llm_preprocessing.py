@@ -1,4 +1,6 @@
 """Script to handle the pre-processing steps for incoming output from query executor """
+import re
+import sys
 import logging
 # basic log info 
 logging.basicConfig(
@@ -7,6 +9,15 @@ logging.basicConfig(
 # deifne single logger for context builder
 logger=logging.getLogger("LLM_Preprocessing")
 
+# genre separators -> pipes or commas, split in one pass
+GENRE_SEPARATOR = re.compile(r"[|,]")
+# slot keys converted to int / float -> built once, not per slot
+YEAR_SLOT_KEYS = frozenset({"year", "start_year", "end_year"})
+RATING_SLOT_KEYS = frozenset({"min_rating", "max_rating", "rating"})
+# intents ranked by rating, then ratings count, then title
+RATING_RANKED_INTENTS = frozenset({"TOP_N", "RECOMMEND_BY_FILTER", "RECOMMEND"})
+
+
 # normalise the query output for LLM
 def normalise_query_output(data, max_results=10):
     """Main function to trigger the preprocessing steps.
@@ -47,6 +58,12 @@ def to_int(value, default=None):
     Returns: 
         Int value, default to None if conversation fails.
     """
+    # already an int -> nothing to convert
+    if type(value) is int:
+        return value
+    # missing value -> default without raising
+    if value is None:
+        return default
     # try to convert to integer
     try:
         return int(value)
@@ -65,6 +82,12 @@ def to_float(value, default=None):
     Returns: 
         float value, default to None if conversation fails.
     """
+    # already a float -> nothing to convert
+    if type(value) is float:
+        return value
+    # missing value -> default without raising
+    if value is None:
+        return default
     # try to convert to floatt
     try:
         return float(value)
@@ -118,10 +141,10 @@ def normalize_slots(slots):
     # iterate over all slot keys and values
     for key, value in slots.items():
         # if key is a year field, convert to int
-        if key in {"year", "start_year", "end_year"}:
+        if key in YEAR_SLOT_KEYS:
             clean_slots[key] = to_int(value)
         # if key is a rating field, convert to float
-        elif key in {"min_rating", "max_rating", "rating"}:
+        elif key in RATING_SLOT_KEYS:
             clean_slots[key] = to_float(value)
         # else slot as it is
         else:
@@ -145,28 +168,30 @@ def normalize_result_row(row):
     if not isinstance(row, dict):
         return None
 
+    # bind the row getter once
+    g = row.get
     # extract movie id (accept multiple possible keys)
-    movie_id = row.get("movieId") or row.get("movie_id")
+    movie_id = g("movieId") or g("movie_id")
     # extract title
-    title = row.get("title")
+    title = g("title")
     # skip if id or title missing
     if movie_id is None or not isinstance(title, str):
         return None
 
     # normalize numeric fields -> year, ratings, similarity
-    year = to_int(row.get("year"))
-    avg_rating = to_float(row.get("avg_rating") or row.get("rating") or row.get("avgRating"))
-    num_ratings = to_int(row.get("num_ratings") or row.get("ratings_count") or row.get("numRatings"))
-    similarity = to_float(row.get("similarity"))
+    year = to_int(g("year"))
+    avg_rating = to_float(g("avg_rating") or g("rating") or g("avgRating"))
+    num_ratings = to_int(g("num_ratings") or g("ratings_count") or g("numRatings"))
+    similarity = to_float(g("similarity"))
 
     # normalize genres into a list
-    genres = row.get("genres")
+    genres = g("genres")
     if isinstance(genres, str):
         # split by commas or pipes, clean whitespace
-        genres_list = [g.strip() for g in genres.replace("|", ",").split(",") if g.strip()]
+        genres_list = [sys.intern(genre) for genre in map(str.strip, GENRE_SEPARATOR.split(genres)) if genre]
     elif isinstance(genres, list):
         # ensure every genre is a clean string
-        genres_list = [str(g).strip() for g in genres if str(g).strip()]
+        genres_list = [sys.intern(genre) for genre in map(str.strip, map(str, genres)) if genre]
     else:
         # default to empty list if missing
         genres_list = []
@@ -203,14 +228,27 @@ def dedupe_and_collect(results):
     movie_row_set = set()
     # empty list to store the movies row
     clean_rows = []
+    # bind the hot methods once
+    movie_row_set_add = movie_row_set.add
+    clean_rows_append = clean_rows.append
     # iterate over raw results
     for row in results:
+        # skip invalid rows - if not a dict
+        if not isinstance(row, dict):
+            continue
+        # read the id first -> duplicates skip the full normalisation
+        movie_id = row.get("movieId") or row.get("movie_id")
+        if movie_id is None:
+            continue
+        movie_id = str(movie_id)
+        if movie_id in movie_row_set:
+            continue
         # normalise result row - invoking (normalize_result_row)
         clean_row = normalize_result_row(row)
         # keep valid and unique rows
-        if clean_row and clean_row["movieId"] not in movie_row_set:
-            movie_row_set.add(clean_row["movieId"])
-            clean_rows.append(clean_row)
+        if clean_row:
+            movie_row_set_add(movie_id)
+            clean_rows_append(clean_row)
     return clean_rows
 
 
@@ -236,39 +274,29 @@ def sort_and_limit_result_size(
         List: result list after sorting and limiting the size to max_results.
 
     """
-    ### intent sorting logic ##
-    # check if TOP_N
-    if intent == "TOP_N":
-        results.sort(key=lambda r: (
+    ### intent sorting logic -> pick the key, then sort once ##
+    # check if TOP_N, RECOMMEND_BY_FILTER or RECOMMEND
+    if intent in RATING_RANKED_INTENTS:
+        sort_key = lambda r: (
             -(r["avg_rating"] if r["avg_rating"] is not None else float("-inf")),
             -(r["num_ratings"] if r["num_ratings"] is not None else -1),
-            r["title"]
-        ))
-    
+            r["title"])
+
     # check if SIMILAR_MOVIES
     elif intent == "SIMILAR_MOVIES":
-        results.sort(key=lambda r: (
+        sort_key = lambda r: (
             -(r.get("similarity") if r.get("similarity") is not None else float("-inf")),
             -(r["avg_rating"] if r["avg_rating"] is not None else float("-inf")),
-            r["title"]
-        ))
-    
-    # check if RECOMMEND_BY_FILTER or RECOMMEND
-    elif intent in {"RECOMMEND_BY_FILTER", "RECOMMEND"}:
-        results.sort(key=lambda r: (
-            -(r["avg_rating"] if r["avg_rating"] is not None else float("-inf")),
-            -(r["num_ratings"] if r["num_ratings"] is not None else -1),
-            r["title"]
-        ))
-    
+            r["title"])
+
     # check if GET_DETAILS
     elif intent == "GET_DETAILS":
-        results.sort(key=lambda r: (r["title"], r["year"] if r["year"] is not None else 0))
+        sort_key = lambda r: (r["title"], r["year"] if r["year"] is not None else 0)
     else:
-        results.sort(key=lambda r: (
+        sort_key = lambda r: (
             -(r["avg_rating"] if r["avg_rating"] is not None else float("-inf")),
-            r["title"]
-        ))
+            r["title"])
+    results.sort(key=sort_key)
 
     # return only up to max_results items
     return results[:max_results if isinstance(max_results, int) and max_results > 0 else 10]
@@ -276,7 +304,6 @@ def sort_and_limit_result_size(
 
 
 
-
 # ## driver scripts
 # if __name__ == "__main__": 
 #     query_executor = {
@@ -1,5 +1,6 @@
 """Script for LLM Prompt Building"""
 import logging
+from itertools import islice
 # basic log info 
 logging.basicConfig(
     level=logging.INFO,
@@ -7,6 +8,17 @@ logging.basicConfig(
 # deifne single logger for context builder
 logger=logging.getLogger("LLM_Context_Builder")
 
+# constant system prefix -> identical guardrails on every request, only the tone varies at the end
+SYSTEM_PROMPT_PREFIX = (
+    "You are a helpful movie assistant.\n"
+    "Be concise (1–3 sentences).\n"
+    "Start directly with the result (e.g., 'I found 5 titles …').\n"
+    "Do NOT use meta phrases like 'Based on the provided information' or 'Here is a summary'.\n"
+    "Use only the facts provided. Do not invent movies or data.\n"
+    "Prefer compact phrasing; use semicolons to list titles when helpful.\n"
+    "Format rating as '4.2★' and counts as short form (e.g., '12 ratings').\n"
+    "Tone: ")
+
 
 # new version - build LLM prompt  -> build role-aware messages for chat models (system + user)
 def build_llm_prompt(
@@ -40,16 +52,8 @@ def build_llm_prompt(
     # read the human-readable rating bounds text
     rating_bounds_text = context.get("rating_bounds")
 
-    # SYSTEM: tone and guardrails->  keep the instruction short and prescriptive; ban meta-openers explicitly
-    system_instruction = (
-        "You are a helpful movie assistant.\n"
-        f"Write in a {tone} tone.\n"
-        "Be concise (1–3 sentences).\n"
-        "Start directly with the result (e.g., 'I found 5 titles …').\n"
-        "Do NOT use meta phrases like 'Based on the provided information' or 'Here is a summary'.\n"
-        "Use only the facts provided. Do not invent movies or data.\n"
-        "Prefer compact phrasing; use semicolons to list titles when helpful.\n"
-        "Format rating as '4.2★' and counts as short form (e.g., '12 ratings').\n")
+    # SYSTEM: constant guardrails first, the variable tone only at the very end
+    system_instruction = f"{SYSTEM_PROMPT_PREFIX}{tone}\n"
 
    
     logger.info(f"Compiling fact blocks from result for chat messages context..")
@@ -186,13 +190,8 @@ def make_facts_lines(
     """
     # create a list to collect formatted lines
     lines = []
-    # keep a simple counter to enforce the limit
-    count = 0
-    # loop through result rows in order (already sorted upstream)
-    for row in results:
-        # stop if we already reached the limit
-        if count >= max_items:
-            break
+    # loop through the first max_items result rows (already sorted upstream)
+    for row in islice(results, max(max_items, 0)):
         # read title safely
         title = row.get("title") or ""
         # read year safely
@@ -201,10 +200,8 @@ def make_facts_lines(
         avg_rating = row.get("avg_rating")
         # read ratings count safely
         num_ratings = row.get("num_ratings")
-        # read genres safely and join them into a short string
-        genres_list = row.get("genres") or []
-        # join genres with comma for readability
-        genres_text = ", ".join(genres_list) if genres_list else ""
+        # read genres safely and join them with comma for readability
+        genres_text = ", ".join(row.get("genres") or ())
         # format rating text with one decimal when available
         rating_text = f"{avg_rating:.1f}/5" if isinstance(avg_rating, (int, float)) else "rating n/a"
         # format ratings count text when available
@@ -214,11 +211,7 @@ def make_facts_lines(
         # build the genres text part safely
         genres_bracket = f" — [{genres_text}]" if genres_text else ""
         # compose one bullet line deterministically
-        line = f"• {title}{year_text} — {rating_text} — {count_text}{genres_bracket}"
-        # append the line to the list
-        lines.append(line)
-        # increase the counter
-        count += 1
+        lines.append(f"• {title}{year_text} — {rating_text} — {count_text}{genres_bracket}")
     # return all collected lines
     return lines
 
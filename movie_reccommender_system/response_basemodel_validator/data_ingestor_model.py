@@ -0,0 +1,53 @@
+""" Data Ingestor Response Validator using pydantic basemodel"""
+from typing import Optional
+from typing_extensions import TypedDict
+from pydantic import BaseModel, Field
+
+
+# pydantic needs typing_extensions.TypedDict on python < 3.12
+# insert step output -> plain dict, no validation inside the ingestor
+class InsertTD(TypedDict):
+    """Output of the movies + ratings insertion step."""
+    status: str
+    message: str
+    movie_rows: int
+    rating_rows: int
+
+
+# genres step output
+class GenresTD(TypedDict):
+    """Output of the genres + movie_genres step."""
+    success: bool
+    message: str
+    genre_count: int
+    movie_genre_links: int
+
+
+# movie stats step output
+class StatsTD(TypedDict):
+    """Output of the per-movie rating stats step."""
+    success: bool
+    message: str
+    updated_movies: int
+
+
+# all three steps -> None when the pipeline stopped before a step
+class MovielensCompleteResponse(BaseModel):
+    """Per-step outputs of the full ingestion run."""
+    # insert step output
+    insert_movielens: Optional[InsertTD] = None
+    # genres step output
+    genres_movie_ratings: Optional[GenresTD] = None
+    # movie stats step output
+    movie_rating_stats: Optional[StatsTD] = None
+
+
+# full ingestion response -> validated once at the API boundary
+class MovieLensIgenstorResponse(BaseModel):
+    """Response body for the MovieLens ingestion run."""
+    # True only if all steps passed
+    success: bool
+    # summary message
+    message: str = Field(default="")
+    # per-step outputs
+    steps: MovielensCompleteResponse
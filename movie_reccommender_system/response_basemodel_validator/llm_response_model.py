@@ -1,11 +1,13 @@
 """ LLM Response Validator using pydantic basemodel"""
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Define a request object that holds SQL executor results + options
 class AnswerRequest(BaseModel):
     """Input object for the answering pipeline."""
+    # unknown keys are dropped, defaults are trusted as-is
+    model_config = ConfigDict(extra="ignore", validate_default=False)
     # excutor payload containing - {intent, slots, results}
     executor_payload: Optional[Dict[str, Any]] = Field(default=None)
     # maximum results to keep after edge handling
@@ -25,20 +27,21 @@ class AnswerRequest(BaseModel):
 # Define a response object for the pipeline
 class AnswerResponse(BaseModel):
     """Output object for the conversation answering."""
+    # built by the pipeline itself -> see model_construct in llm_client
+    model_config = ConfigDict(extra="ignore", validate_default=False)
     # intent
     intent: str
     # slots
     slots: Dict[str, Any]
     # final results after edge handling
-    results: list
+    results: List[Dict[str, Any]]
     # compact context with metadata
     context: Dict[str, Any]
-    # LLM model info and params
-    llm: Dict[str, Any]
     # preview of the generated prompt for debugging
     prompt_preview: str
     # final answer from the LLM
     answer: str
     # timing metrics in milliseconds
     timing_ms: Dict[str, int]
+    # LLM model info and params
     llm: Optional[Dict[str, Any]]
\ No newline at end of file
@@ -1,8 +1,39 @@
 """Pydantic basemodel for user intent and slots for rule based parser."""
-from pydantic import BaseModel, Field, validator, computed_field
+from enum import IntEnum
+from pydantic import BaseModel, ConfigDict, Field, validator, computed_field, field_validator, field_serializer
 from typing import List, Optional, Literal, Dict, Any
 
 
+# user intent as a small int enum
+class Intent(IntEnum):
+    """User intents as small ints -> validated by one lookup, sent on the wire by name.
+        - values start at 1 so every intent is truthy.
+    """
+    GET_DETAILS = 1
+    RECOMMEND_BY_FILTER = 2
+    TOP_N = 3
+    SIMILAR_MOVIES = 4
+    UNKNOWN = 5
+
+    # show the name in logs and f-strings
+    def __str__(self):
+        return self.name
+
+    def __format__(self, format_spec):
+        return format(self.name, format_spec)
+
+    # convert intent name/int into Intent
+    @classmethod
+    def coerce(cls, value):
+        """Return the Intent for an Intent, an int id or an intent name."""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[value] if isinstance(value, str) else cls(value)
+        except (KeyError, ValueError):
+            raise ValueError(f"Unknown intent: {value!r}")
+
+
 # query parser Class - using the FastAPI Pydantic basemodel
 class QueryParser(BaseModel):
     """Clsss - parsing user text into an intent and slots.
@@ -14,14 +45,12 @@ class QueryParser(BaseModel):
         - SIMILAR_MOVIES → user wants movies like a given movie (e.g. movies like Inception).
         - UNKNOWN → query did not match any known intent (fallback or LLM needed).
     """
-    # user's intent  as a simple literal string (mentioned in above comments)
+    # immutable parsed query, no unknown slots
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    # user's intent as Intent enum (mentioned in above comments)
     # intent_list =["GET_DETAILS", "RECOMMEND_BY_FILTER", "TOP_N", "SIMILAR_MOVIES", "UNKNOWN"]
-    intent: Literal[
-        "GET_DETAILS",
-        "RECOMMEND_BY_FILTER",
-        "TOP_N",
-        "SIMILAR_MOVIES",
-        "UNKNOWN",] = Field(..., description="The type of user intent detected.")
+    intent: Intent = Field(..., description="The type of user intent detected.")
 
     # raw user text we parsed
     raw_text: str=Field(..., description="The original user text.")
@@ -57,6 +86,17 @@ class QueryParser(BaseModel):
     sort: Optional[Literal["rating", "popularity", "recent"]] = Field(
         None, description="Sort preference.")
 
+    # accept intent names as well as Intent members
+    @field_validator("intent", mode="before")
+    @classmethod
+    def validate_intent_name(cls, value):
+        return Intent.coerce(value)
+
+    # send the intent name on the wire
+    @field_serializer("intent")
+    def serialize_intent_name(self, value: Intent) -> str:
+        return value.name
+
 
 # request parser basemodel
 class ParseRequest(BaseModel):
@@ -96,7 +136,11 @@ class ExecuteParsedRequest(BaseModel):
 class SingleRowMovieRecord(BaseModel):
     """One row returned from SQL — a minimal movie record.
         - Single row representation for the movie records.
+        - Built with model_construct from typed SQLite rows (no per-row validation).
     """
+    # immutable row, no unknown fields
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     # movie title to display
     title: str
     # release year for display
@@ -1,8 +1,9 @@
 """ Main Client script """
-import json
-import time
-import requests
+import asyncio
+import orjson
+import httpx
 import logging
+from typing import List
 # basic logging
 logging.basicConfig(
     level=logging.INFO,
@@ -11,45 +12,89 @@ logging.basicConfig(
 
 # Movielens responder
 API_URL = "http://127.0.0.1:8000/api/movielens/answer"
+# json content type header for pre-encoded orjson bodies
+JSON_HEADERS = {"content-type": "application/json"}
+# connect fast, allow the LLM time to answer
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=1.0)
+# keep-alive pool shared by all queries of one client
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+
+
+# display one response
+def show_movie_answer(response_data: dict) -> None:
+    """Function to display the answer from the FastAPI response.
+
+    Args:
+        response_data (dict): Parsed JSON response from the API.
+    """
+    # extract only the "answer" field from the nested response
+    answer = response_data.get("movielens_prompt_answer_dict", {}).get("answer")
+
+    # check if answer exists then display
+    if answer:
+        print(f"\nAnswer: {answer}\n")
+    else:
+        # if no "answer" field, log a warning and print the full response
+        logging.warning(f"No 'answer' found in response.")
+        logging.info(f"{orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()}")
 
 
 # send a query to the FastAPI server and print the response
-def send_movie_query(
+async def send_movie_query(
         user_query: str, 
-        http_session: requests.Session) -> None:
+        http_client: httpx.AsyncClient) -> None:
     """Function to send a query to the FastAPI server and display the reponse.
 
     Args:
         user_query (str): Incoming user query from payload.
-        http_session (requests.Session): Persistent HTTP session for sending requests.
+        http_client (httpx.AsyncClient): Pooled async HTTP client for sending requests.
     """
     # build the payload to send in the POST request
     payload = {"text": user_query}
 
     try:
-        # send POST request to API with payload
-        response = http_session.post(
+        # send POST request to API with orjson encoded payload
+        response = await http_client.post(
             API_URL, 
-            json=payload, 
-            timeout=20)
+            content=orjson.dumps(payload), 
+            headers=JSON_HEADERS)
         # raise an exception if the request returned an error status code
         response.raise_for_status()
-        # parse the response JSON into a dictionary
-        response_data = response.json()
-        # extract only the "answer" field from the nested response
-        answer = response_data.get("movielens_prompt_answer_dict", {}).get("answer")
-
-        # check if answer exists then display
-        if answer:
-            print(f"\nAnswer: {answer}\n")
-        else:
-            # if no "answer" field, log a warning and print the full response
-            logging.warning(f"No 'answer' found in response.")
-            logging.info(f"{json.dumps(response_data, indent=2)}")
-    except requests.exceptions.RequestException as error:
+        # parse the response JSON into a dictionary and display
+        show_movie_answer(orjson.loads(response.content))
+    except httpx.HTTPError as error:
         logging.error(f"Request failed: {error}")
 
 
+# send many queries concurrently
+async def send_movie_queries(
+        user_queries: List[str], 
+        http_client: httpx.AsyncClient) -> None:
+    """Function to send a batch of queries concurrently over the pooled client.
+
+    Args:
+        user_queries (List[str]): Queries to send.
+        http_client (httpx.AsyncClient): Pooled async HTTP client for sending requests.
+    """
+    # pipeline all requests, bounded by the client pool limits
+    await asyncio.gather(*(send_movie_query(user_query, http_client) for user_query in user_queries))
+
+
+# batch client
+def movielens_batch_client(user_queries: List[str]):
+    """Movielens Client to send a list of movie queries concurrently.
+
+    Args:
+        user_queries (List[str]): Queries to send.
+    """
+    # run the whole batch on one pooled client
+    async def run_batch():
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS) as http_client:
+            await send_movie_queries(user_queries, http_client)
+
+    asyncio.run(run_batch())
+
+
 # Main client
 def movielens_sys_client(max_attempts: int = 5):
     """Movielens Client to send movie queries repeatedly until user exits.
@@ -64,13 +109,15 @@ def movielens_sys_client(max_attempts: int = 5):
     """
     logging.info(f"MovieLens client ready.")
     logging.info(f"Type your movie query, or 'exit'/'quit' to leave. Press Ctrl+C anytime to quit.\n")
-    try:
-        # create  HTTP session
-        with requests.Session() as http_session:
+
+    # interactive loop on one pooled client
+    async def run_interactive():
+        # create pooled HTTP client
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS) as http_client:
             # infinite loop to keep asking user for input
             for attempt_number in range(1, max_attempts + 1):
-                # Show attempt count prompt and read user input
-                user_input = input(f"query [{attempt_number}/{max_attempts}]> ").strip()
+                # Show attempt count prompt and read user input (off the event loop)
+                user_input = (await asyncio.to_thread(input, f"query [{attempt_number}/{max_attempts}]> ")).strip()
 
                 # if input is empty then skip this loop and ask again
                 if not user_input:
@@ -82,10 +129,12 @@ def movielens_sys_client(max_attempts: int = 5):
                     print("Bye!")
                     break
                 # call the function to send the query to FastAPI server
-                send_movie_query(user_input, http_session)
+                await send_movie_query(user_input, http_client)
                 # small pause to avoid overwhelming the server
-                time.sleep(0.05)
-    
+                await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(run_interactive())
     except KeyboardInterrupt:
         print(f"\nInterrupted. Bye!")
     except Exception as unexpected_error:
@@ -96,7 +145,6 @@ def movielens_sys_client(max_attempts: int = 5):
 
 
 
-
 # # movielens recommender system client file
 # def movielens_sys_client():
 #     try:
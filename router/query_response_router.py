@@ -11,6 +11,7 @@ from movie_reccommender_system.query_processor.rules_based_parser import user_qu
 from movie_reccommender_system.response_basemodel_validator import query_processor_model
 from movie_reccommender_system.query_processor.query_processor_main import MovielensQueryProcessor
 from movie_reccommender_system.response_basemodel_validator import llm_response_model
+from movie_reccommender_system.response_basemodel_validator import data_ingestor_model
 from movie_reccommender_system.query_responder import llm_client
 # define basic config
 logging.basicConfig(
@@ -51,19 +52,21 @@ def api_movielen_recommender(req:MovieLensRecReq):
     """ POST MOvielens reccommeder system - Responder."""
     try:
 
-        logger.info(f"Started to parse the incoming request..")
+        logger.info("Started to parse the incoming request..")
         text = (req.text or "").strip()
-        logger.info(f"Started to validate the incoming request..")
+        logger.info("Started to validate the incoming request..")
         if not text:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 details="Invalid request: 'text' field is required.")
 
         try:
-            logger.info(f"Starting to insert the data into sqlite..")
-            data_ingestor_response=DataIngestor.run_data_ingestor() 
+            logger.info("Starting to insert the data into sqlite..")
+            # validate the whole ingestion summary once at the response edge
+            data_ingestor_response=data_ingestor_model.MovieLensIgenstorResponse.model_validate(
+                DataIngestor.run_data_ingestor())
         except Exception as data_ingestor_error:
-            logger.exception(f"Movielens data ingestion failed.")
+            logger.exception("Movielens data ingestion failed.")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Movielens Data Ingestion failed: {str(data_ingestor_error)}")
@@ -75,9 +78,11 @@ def api_movielen_recommender(req:MovieLensRecReq):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Unable to parse the query. Please provide a valid request.")
-        logger.info(f"Parsed query -> intent: {parsed.intent}, slots: {parsed.dict() if hasattr(parsed,'dict') else parsed}")
+        # only dump the slots when the record will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Parsed query -> intent: %s, slots: %s", parsed.intent, parsed.model_dump() if hasattr(parsed,'model_dump') else parsed)
     
-        logger.info(f"Started to process the user's query after parser..")
+        logger.info("Started to process the user's query after parser..")
         try:
             query_processor_output, _=queryProcessor.query_executor_output_handler(parsed, limit=10)
         except Exception as query_processor_erorr:
@@ -87,7 +92,7 @@ def api_movielen_recommender(req:MovieLensRecReq):
                 detail=f"Query processor failed: {str(query_processor_erorr)}")
         
 
-        logger.info(f"Validate the request format before LLM inference..")
+        logger.info("Validate the request format before LLM inference..")
         try:
             requested_query=llm_response_model.AnswerRequest(
                 executor_payload=query_processor_output, 
@@ -100,7 +105,7 @@ def api_movielen_recommender(req:MovieLensRecReq):
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail=f"Invalid request payload: {llm_basemodel_res_error.errors()}")
 
-        logger.info(f"Starting to responder the user's query.")
+        logger.info("Starting to responder the user's query.")
         try:
             output_response = llm_client.generate_query_response(
                 requested_query,
@@ -112,7 +117,7 @@ def api_movielen_recommender(req:MovieLensRecReq):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"LLM client error: {str(llm_response_error)}")
         
-        logger.info(f"Starting to normalise the final recommender response.")
+        logger.info("Starting to normalise the final recommender response.")
         try:
             # check if response is not empty
             if not output_response:
@@ -128,7 +133,7 @@ def api_movielen_recommender(req:MovieLensRecReq):
                 detail=f"Invalid or empty response from LLM: {str(resp_error)}")
 
 
-        logger.info(f"Successfully completed the Query's reponse..")
+        logger.info("Successfully completed the Query's reponse..")
         return {
             "data_insertion":data_ingestor_response, 
             "llm_query_responsder":output_response,
@@ -94,6 +94,18 @@ class TestLoadMovieLensData(unittest.TestCase):
         self.assertIn("most_rated_movie", out)
         logger.info("Movies Rating EDA Test passed.")
 
+    # test for iter_ratings_batches
+    def test_iter_ratings_batches(self):
+        """Test that ratings stream as tuple batches capped at chunk_size."""
+        logger.info(f"Streaming the ratings data in small batches.")
+        # stream with chunk size 2
+        batches = list(data_loader.iter_ratings_batches(self.temp_dir, chunk_size=2))
+        # check batch sizes
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        # check first row as plain tuple
+        self.assertEqual(batches[0][0], (1, 1, 5, 874965758))
+        logger.info("Ratings streaming Test passed.")
+
 
 # if __name__ == "__main__":
 #     unittest.main(verbosity=2)
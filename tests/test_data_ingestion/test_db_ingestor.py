@@ -77,6 +77,26 @@ class TestSqliteInserts(unittest.TestCase):
         logger.info("Successfully passed the DB insertion test.")
 
 
+    # test insert with streamed ratings batches
+    def test_insert_with_ratings_batches(self):
+        """Verify streamed ratings batches are all inserted and missing ratings input is rejected."""
+        logger.info("Running test_insert_with_ratings_batches..")
+        # split the ratings into two streamed batches
+        rows = list(self.ratings_df.itertuples(index=False, name=None))
+        out = db_ingestor.insert_movies_and_ratings_into_sqlite(
+            movies_df=self.movies_df,
+            db_file_path=self.db_path,
+            ratings_batches=iter([rows[:2], rows[2:]]))
+        # check rating rows
+        self.assertEqual(out["rating_rows"], 3)
+        # no ratings input at all -> clear error
+        with self.assertRaises(ValueError):
+            db_ingestor.insert_movies_and_ratings_into_sqlite(
+                movies_df=self.movies_df,
+                db_file_path=self.db_path)
+        logger.info("Successfully passed the streamed ratings insertion test.")
+
+
     # test create genres table
     def test_create_genres_tbl(self):
         """Verify genres and movie_genres tables are created and populated."""
@@ -2,6 +2,7 @@
 import unittest
 import logging
 from movie_reccommender_system.query_processor import rules_based_parser
+from movie_reccommender_system.response_basemodel_validator.query_processor_model import Intent
 # set up logging for this test file
 logging.basicConfig(
     level=logging.INFO, 
@@ -149,25 +150,25 @@ class TestRuleBasedParser(unittest.TestCase):
         # parse detail query
         p1 = rules_based_parser.user_query_parser(q1)
         # assert detail intent
-        self.assertEqual(p1.intent, "GET_DETAILS")
+        self.assertEqual(p1.intent, Intent.GET_DETAILS)
         # define similar query
         q2 = "movies like Toy Story"
         # parse similar query
         p2 = rules_based_parser.user_query_parser(q2)
         # assert similar intent
-        self.assertEqual(p2.intent, "SIMILAR_MOVIES")
+        self.assertEqual(p2.intent, Intent.SIMILAR_MOVIES)
         # define top n query
         q3 = "top 5 comedy"
         # parse top n
         p3 = rules_based_parser.user_query_parser(q3)
         # assert top n intent
-        self.assertEqual(p3.intent, "TOP_N")
+        self.assertEqual(p3.intent, Intent.TOP_N)
         # define recommend query
         q4 = "recommend drama since 2010 rating at least 4"
         # parse recommend
         p4 = rules_based_parser.user_query_parser(q4)
         # assert recommend intent
-        self.assertEqual(p4.intent, "RECOMMEND_BY_FILTER")
+        self.assertEqual(p4.intent, Intent.RECOMMEND_BY_FILTER)
 
 
 # if __name__ == "__main__":
@@ -23,6 +23,11 @@ class TestLLMConversationalRenderer(unittest.TestCase):
         self.assertEqual(llm_conversational_renderer.format_count(1200), "1k")
         # assert millions formatting
         self.assertEqual(llm_conversational_renderer.format_count(1500000), "1.5M")
+        # assert whole millions drop the trailing .0 (including 10M)
+        self.assertEqual(llm_conversational_renderer.format_count(1000000), "1M")
+        self.assertEqual(llm_conversational_renderer.format_count(10000000), "10M")
+        # assert half-way values keep the one-decimal float formatting
+        self.assertEqual(llm_conversational_renderer.format_count(1250000), "1.2M")
         # assert unknown case formatting
         self.assertEqual(llm_conversational_renderer.format_count(None), "unknown")
 